@@ -10,6 +10,8 @@ from logger.logging import LoggerUtil
 from utils.contextvar import get_request_json_post_payload
 from utils.exceptions import CustomBadRequest, CustomUnauthorized
 
+BEARER_PREFIX = "Bearer "
+
 
 def validate_json_payload(payload_validation_schema: dict):
     def decorator(func):
@@ -121,12 +123,12 @@ def require_internal_authentication(func):
             raise CustomUnauthorized(detail="Authorization header required")
 
         # Check for Bearer token format
-        if not auth_header.startswith("Bearer "):
+        if not auth_header.startswith(BEARER_PREFIX):
             LoggerUtil.create_error_log("Invalid Authorization header format for internal auth")
             raise CustomUnauthorized(detail="Invalid authorization format")
 
         # Extract the token
-        token = auth_header[7:]  # Remove "Bearer " prefix
+        token = auth_header[len(BEARER_PREFIX) :]  # Remove "Bearer " prefix
 
         # Validate against internal API key
         if token != env.INTERNAL_AUTH_API_KEY:
@@ -0,0 +1,87 @@
+import os
+import threading
+import weakref
+from multiprocessing import util as mp_util
+
+# Records at or above this level (loguru's ERROR) are written immediately, never buffered
+SYNC_LEVEL_NO = 40
+
+# Sinks alive in this process, so a forked child can reset each of them
+_live_sinks = weakref.WeakSet()
+
+
+class BatchedSink:
+    """
+    Loguru sink that buffers formatted messages and writes them to the wrapped
+    stream in batches: as soon as batch_size messages are pending, or every
+    flush_interval seconds, whichever comes first. ERROR and above are written
+    straight away, together with anything pending, so they survive a hard kill.
+
+    It intentionally has no flush() method, since loguru flushes stream sinks
+    after every write. Pending messages are written on stop(), which loguru
+    calls when the handler is removed (including at interpreter exit), and
+    when a forked multiprocessing child exits.
+    """
+
+    def __init__(self, stream, batch_size: int = 100, flush_interval: float = 0.05):
+        self._stream = stream
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._reset()
+        _live_sinks.add(self)
+        mp_util.register_after_fork(self, BatchedSink._register_exit_drain)
+
+    def write(self, message):
+        record = getattr(message, "record", None)
+        with self._lock:
+            self._buffer.append(message)
+            if len(self._buffer) >= self._batch_size or (record is not None and record["level"].no >= SYNC_LEVEL_NO):
+                self._write_buffer()
+            elif self._flusher is None:
+                # Started on first use so importing the logger does not spawn a thread
+                self._flusher = threading.Thread(target=self._flush_periodically, name="log-batch-flusher", daemon=True)
+                self._flusher.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            self._write_buffer()
+
+    def isatty(self):
+        # Lets loguru decide on colorization based on the wrapped stream
+        return self._stream.isatty()
+
+    def _reset(self):
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher = None
+
+    def _register_exit_drain(self):
+        # multiprocessing children leave through os._exit, which skips loguru's atexit stop()
+        mp_util.Finalize(self, self.stop, exitpriority=0)
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self._flush_interval):
+            with self._lock:
+                self._write_buffer()
+
+    def _write_buffer(self):
+        # Must be called with the lock held
+        if not self._buffer:
+            return
+        self._stream.write("".join(self._buffer))
+        self._stream.flush()
+        self._buffer.clear()
+
+
+def _reset_sinks_after_fork():
+    # The parent still owns and writes whatever was pending at fork time, and the
+    # flusher thread and lock state do not carry over, so each sink starts clean
+    for sink in list(_live_sinks):
+        sink._reset()
+
+
+os.register_at_fork(after_in_child=_reset_sinks_after_fork)
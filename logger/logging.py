@@ -2,30 +2,46 @@ import sys
 
 from loguru import logger
 
+from logger.batched_sink import BatchedSink
 from utils.contextvar import get_request_metadata
 
-# Configure logger with a default sink to stdout
+# Longer messages are truncated to this many characters; both log methods check the length
+# first so messages already within the limit skip the slice call
+MAX_LOG_MESSAGE_LENGTH = 5000
+
+
+def add_stdout_sink():
+    # Default sink to stdout, written in batches
+    return logger.add(
+        BatchedSink(sys.stdout, batch_size=100, flush_interval=0.05),
+        format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        level="INFO",
+    )
+
+
+# Configure logger with the default sink only
 logger.remove()  # Remove default handler
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO",
-)
+add_stdout_sink()
+# Records logged outside a request (startup, tasks, scripts) still carry the request keys
+logger.configure(extra={"api_id": "", "thread_id": ""})
 
 
 class LoggerUtil:
+    @classmethod
+    def contextualize_request(cls):
+        # Attach the request metadata to every log emitted within the returned context
+        return logger.contextualize(**get_request_metadata())
+
     @classmethod
     def create_info_log(cls, message):
         # Truncate message if too long
-        message = message[:5000]
-        metadata = get_request_metadata()
-        # Combine message with metadata
-        logger.bind(**metadata).info(message)
+        if len(message) > MAX_LOG_MESSAGE_LENGTH:
+            message = message[:MAX_LOG_MESSAGE_LENGTH]
+        logger.info(message)
 
     @classmethod
     def create_error_log(cls, message):
         # Truncate message if too long
-        message = message[:5000]
-        metadata = get_request_metadata()
-        # Combine message with metadata
-        logger.bind(**metadata).error(message)
+        if len(message) > MAX_LOG_MESSAGE_LENGTH:
+            message = message[:MAX_LOG_MESSAGE_LENGTH]
+        logger.error(message)
@@ -1,4 +1,5 @@
-import jinja2
+import functools
+import os
 
 from config.non_env import (
     CREATE_REPLY_AGENT,
@@ -14,9 +15,36 @@ AGENT_NAME_PROMPT_MAPPING = {
 }
 
 # Current supported platforms
-ALL_PLATFORMS = ["youtube", "instagram"]
+ALL_PLATFORMS = ("youtube", "instagram")
 
-_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("prompts"))
+
+@functools.cache
+def _get_env():
+    # Import jinja2 on first render so importing the constants above stays cheap.
+    # Templates ship with the code, so skip the per-lookup mtime check
+    import jinja2
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(os.path.dirname(os.path.abspath(__file__))),
+        auto_reload=False,
+    )
+
+
+@functools.cache
+def _get_template(agent_name: str):
+    # Each agent template is compiled once, on first use
+    return _get_env().get_template(f"{AGENT_NAME_PROMPT_MAPPING[agent_name]}.j2")
+
+
+@functools.lru_cache(maxsize=1024)
+def _render(agent_name: str, platform: str, persona: str) -> str:
+    # Rendering only depends on these arguments, so repeated prompts are served from the cache
+    return _get_template(agent_name).render(
+        all_platforms=ALL_PLATFORMS,
+        persona=persona,
+        platform_name=platform,
+        platform_description=PLATFORM_NAME_DESCRIPTION.get(platform),
+    )
 
 
 class PromptGenerator:
@@ -26,11 +54,4 @@ class PromptGenerator:
         self.persona = persona
 
     def get_prompt_for_agent(self):
-        template = _jinja_env.get_template(f"{AGENT_NAME_PROMPT_MAPPING[self.agent_name]}.j2")
-
-        return template.render(
-            all_platforms=ALL_PLATFORMS,
-            persona=self.persona,
-            platform_name=self.platform,
-            platform_description=PLATFORM_NAME_DESCRIPTION.get(self.platform),
-        )
+        return _render(self.agent_name, self.platform, self.persona)
@@ -115,8 +115,10 @@ async def add_request_metadata(request: Request, call_next):
     thread_id = str(uuid.uuid4())
     clear_request_metadata()
     set_request_metadata({"api_id": api_id, "thread_id": thread_id})
-    await set_context_json_post_payload(request)
-    response = await call_next(request)  # Process the request
+    # Bind the request metadata to the logger once for the whole request
+    with LoggerUtil.contextualize_request():
+        await set_context_json_post_payload(request)
+        response = await call_next(request)  # Process the request
     return response
 
 
@@ -124,7 +126,9 @@ async def add_request_metadata(request: Request, call_next):
 async def unhandled_exception_handler(request: Request, exc: Exception):
     # Log the error with traceback
     error_message = f"Error occurred: {str(exc)}\nTraceback:\n{traceback.format_exc()}"
-    LoggerUtil.create_error_log(error_message)
+    # Runs outside the middleware's contextualize block; the request metadata is still set here
+    with LoggerUtil.contextualize_request():
+        LoggerUtil.create_error_log(error_message)
     return APIResponseFormat(
         status_code=500,
         message="Internal Server Error",
@@ -0,0 +1 @@
+# This file makes the decorators tests directory a Python package
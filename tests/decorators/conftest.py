@@ -0,0 +1,13 @@
+import pytest
+from fastapi import Request
+
+
+@pytest.fixture
+def make_request():
+    """Build a real Request carrying only an optional Authorization header"""
+
+    def _make_request(authorization=None):
+        headers = [] if authorization is None else [(b"authorization", authorization.encode())]
+        return Request({"type": "http", "headers": headers})
+
+    return _make_request
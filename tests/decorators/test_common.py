@@ -265,10 +265,9 @@ class TestRequireInternalAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.common.env.INTERNAL_AUTH_API_KEY", "correct-api-key")
     @patch("decorators.common.LoggerUtil.create_info_log")
-    async def test_require_internal_authentication_with_valid_key(self, mock_logger):
+    async def test_require_internal_authentication_with_valid_key(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer correct-api-key"
+        mock_request = make_request("Bearer correct-api-key")
 
         @require_internal_authentication
         async def test_func(request: Request):
@@ -283,10 +282,9 @@ class TestRequireInternalAuthentication:
 
     @pytest.mark.asyncio
     @patch("decorators.common.LoggerUtil.create_error_log")
-    async def test_require_internal_authentication_no_auth_header(self, mock_logger):
+    async def test_require_internal_authentication_no_auth_header(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = None
+        mock_request = make_request()
 
         @require_internal_authentication
         async def test_func(request: Request):
@@ -301,10 +299,9 @@ class TestRequireInternalAuthentication:
 
     @pytest.mark.asyncio
     @patch("decorators.common.LoggerUtil.create_error_log")
-    async def test_require_internal_authentication_invalid_format(self, mock_logger):
+    async def test_require_internal_authentication_invalid_format(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "InvalidFormat api-key"
+        mock_request = make_request("InvalidFormat api-key")
 
         @require_internal_authentication
         async def test_func(request: Request):
@@ -319,10 +316,9 @@ class TestRequireInternalAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.common.env.INTERNAL_AUTH_API_KEY", "correct-key")
     @patch("decorators.common.LoggerUtil.create_error_log")
-    async def test_require_internal_authentication_wrong_key(self, mock_logger):
+    async def test_require_internal_authentication_wrong_key(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer wrong-key"
+        mock_request = make_request("Bearer wrong-key")
 
         @require_internal_authentication
         async def test_func(request: Request):
@@ -351,10 +347,9 @@ class TestRequireInternalAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.common.env.INTERNAL_AUTH_API_KEY", "test-key")
     @patch("decorators.common.LoggerUtil.create_info_log")
-    async def test_require_internal_authentication_request_in_args(self, mock_logger):
+    async def test_require_internal_authentication_request_in_args(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer test-key"
+        mock_request = make_request("Bearer test-key")
 
         @require_internal_authentication
         async def test_func(request):
@@ -369,10 +364,9 @@ class TestRequireInternalAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.common.env.INTERNAL_AUTH_API_KEY", "test-key")
     @patch("decorators.common.LoggerUtil.create_info_log")
-    async def test_require_internal_authentication_with_kwargs(self, mock_logger):
+    async def test_require_internal_authentication_with_kwargs(self, mock_logger, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer test-key"
+        mock_request = make_request("Bearer test-key")
 
         @require_internal_authentication
         async def test_func(request: Request, data: dict):
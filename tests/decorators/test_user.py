@@ -21,11 +21,10 @@ class TestRequireAuthentication:
         mock_set_context_user,
         mock_get_user,
         mock_auth0_service,
+        make_request,
     ):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer valid-token"
-        mock_request.state = Mock()
+        mock_request = make_request("Bearer valid-token")
 
         mock_auth0_instance = MagicMock()
         mock_auth0_instance.validate_token = AsyncMock(return_value={
@@ -56,10 +55,9 @@ class TestRequireAuthentication:
 
     @pytest.mark.asyncio
     @patch("decorators.user.LoggerUtil.create_error_log")
-    async def test_require_authentication_no_auth_header(self, mock_logger_error):
+    async def test_require_authentication_no_auth_header(self, mock_logger_error, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = None
+        mock_request = make_request()
 
         @require_authentication
         async def test_func(request: Request):
@@ -90,10 +88,9 @@ class TestRequireAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.user.Auth0Service")
     @patch("decorators.user.LoggerUtil.create_error_log")
-    async def test_require_authentication_invalid_token(self, mock_logger_error, mock_auth0_service):
+    async def test_require_authentication_invalid_token(self, mock_logger_error, mock_auth0_service, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer invalid-token"
+        mock_request = make_request("Bearer invalid-token")
 
         mock_auth0_instance = MagicMock()
         mock_auth0_instance.validate_token.side_effect = CustomUnauthorized(detail="Token has expired")
@@ -112,10 +109,9 @@ class TestRequireAuthentication:
     @pytest.mark.asyncio
     @patch("decorators.user.Auth0Service")
     @patch("decorators.user.LoggerUtil.create_error_log")
-    async def test_require_authentication_unexpected_error(self, mock_logger_error, mock_auth0_service):
+    async def test_require_authentication_unexpected_error(self, mock_logger_error, mock_auth0_service, make_request):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer token"
+        mock_request = make_request("Bearer token")
 
         mock_auth0_instance = MagicMock()
         mock_auth0_instance.validate_token.side_effect = Exception("Unexpected error")
@@ -143,11 +139,10 @@ class TestRequireAuthentication:
         mock_set_context_user,
         mock_get_user,
         mock_auth0_service,
+        make_request,
     ):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer valid-token"
-        mock_request.state = Mock()
+        mock_request = make_request("Bearer valid-token")
 
         mock_auth0_instance = MagicMock()
         mock_auth0_instance.validate_token = AsyncMock(return_value={
@@ -179,11 +174,10 @@ class TestRequireAuthentication:
         mock_set_context_user,
         mock_get_user,
         mock_auth0_service,
+        make_request,
     ):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer valid-token"
-        mock_request.state = Mock()
+        mock_request = make_request("Bearer valid-token")
 
         mock_auth0_instance = MagicMock()
         mock_auth0_instance.validate_token = AsyncMock(return_value={
@@ -215,11 +209,10 @@ class TestRequireAuthentication:
         mock_set_context_user,
         mock_get_user,
         mock_auth0_service,
+        make_request,
     ):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer valid-token"
-        mock_request.state = Mock()
+        mock_request = make_request("Bearer valid-token")
 
         token_payload = {
             "sub": "auth0|user123",
@@ -256,11 +249,10 @@ class TestRequireAuthentication:
         mock_set_context_user,
         mock_get_user,
         mock_auth0_service,
+        make_request,
     ):
         # Arrange
-        mock_request = Mock(spec=Request)
-        mock_request.headers.get.return_value = "Bearer valid-token"
-        mock_request.state = Mock()
+        mock_request = make_request("Bearer valid-token")
 
         token_payload = {"sub": "auth0|specificuser", "email": "user@test.com"}
         mock_auth0_instance = MagicMock()
@@ -0,0 +1,57 @@
+import pytest
+from loguru import logger
+
+from logger.logging import add_stdout_sink
+from utils.contextvar import clear_request_metadata, set_request_metadata
+
+
+class CapturedLogs:
+    """Records emitted through the real loguru logger"""
+
+    def __init__(self):
+        self.records = []
+
+    def write(self, message):
+        self.records.append(message.record)
+
+    def clear(self):
+        self.records.clear()
+
+    def messages(self, level):
+        return [record["message"] for record in self.records if record["level"].name == level]
+
+    @property
+    def info_messages(self):
+        return self.messages("INFO")
+
+    @property
+    def error_messages(self):
+        return self.messages("ERROR")
+
+    @property
+    def extras(self):
+        return [record["extra"] for record in self.records]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def loguru_capture():
+    # Swap the stdout sink for an in-memory one once per module, then restore it
+    captured = CapturedLogs()
+    logger.remove()
+    handler_id = logger.add(captured.write, format="{message}", level="INFO")
+    yield captured
+    logger.remove(handler_id)
+    add_stdout_sink()
+
+
+@pytest.fixture
+def captured_logs(loguru_capture):
+    loguru_capture.clear()
+    return loguru_capture
+
+
+@pytest.fixture
+def request_metadata():
+    """set_request_metadata for this test; the metadata is cleared even if the test fails"""
+    yield set_request_metadata
+    clear_request_metadata()
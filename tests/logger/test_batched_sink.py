@@ -0,0 +1,195 @@
+import multiprocessing
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from logger import batched_sink as batched_sink_mod
+from logger.batched_sink import BatchedSink
+
+
+class FakeStream:
+    def __init__(self):
+        self.writes = []
+        self.flush_count = 0
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def flush(self):
+        self.flush_count += 1
+
+    def isatty(self):
+        return False
+
+
+class FakeMessage(str):
+    """A formatted message carrying a loguru-like record, as loguru hands to sinks"""
+
+    def __new__(cls, text, level_no):
+        message = super().__new__(cls, text)
+        message.record = {"level": SimpleNamespace(no=level_no)}
+        return message
+
+
+def _log_in_child(sink):
+    sink.write("child\n")
+
+
+@pytest.fixture
+def stream():
+    return FakeStream()
+
+
+class TestBatchedSink:
+    """Test cases for BatchedSink"""
+
+    def test_batched_sink_flushes_on_size(self, stream):
+        # Arrange - interval long enough to never fire during the test
+        sink = BatchedSink(stream, batch_size=3, flush_interval=60)
+
+        # Act
+        sink.write("a\n")
+        sink.write("b\n")
+        pending_writes = list(stream.writes)
+        sink.write("c\n")
+
+        # Assert
+        assert pending_writes == []
+        assert stream.writes == ["a\nb\nc\n"]
+        assert stream.flush_count == 1
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_flushes_on_interval(self, stream):
+        # Arrange
+        sink = BatchedSink(stream, batch_size=100, flush_interval=0.01)
+
+        # Act
+        sink.write("a\n")
+        deadline = time.monotonic() + 2
+        while not stream.writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert stream.writes == ["a\n"]
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_stop_writes_pending_messages(self, stream):
+        # Arrange
+        sink = BatchedSink(stream, batch_size=100, flush_interval=60)
+        sink.write("a\n")
+        sink.write("b\n")
+
+        # Act
+        sink.stop()
+
+        # Assert
+        assert stream.writes == ["a\nb\n"]
+
+    def test_batched_sink_stop_without_pending_messages(self, stream):
+        # Arrange
+        sink = BatchedSink(stream, batch_size=100, flush_interval=60)
+
+        # Act
+        sink.stop()
+
+        # Assert
+        assert stream.writes == []
+        assert stream.flush_count == 0
+
+    def test_batched_sink_has_no_flush_method(self, stream):
+        # Loguru flushes stream sinks after every write, which would defeat batching
+        sink = BatchedSink(stream, flush_interval=60)
+
+        assert not hasattr(sink, "flush")
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_isatty_delegates_to_stream(self):
+        # Arrange
+        wrapped = Mock()
+        wrapped.isatty.return_value = True
+        sink = BatchedSink(wrapped, flush_interval=60)
+
+        # Act & Assert
+        assert sink.isatty() is True
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_writes_error_records_immediately(self, stream):
+        # Arrange
+        sink = BatchedSink(stream, batch_size=100, flush_interval=60)
+        sink.write(FakeMessage("info\n", 20))
+
+        # Act
+        sink.write(FakeMessage("error\n", 40))
+
+        # Assert - pending messages go out with the error, in order
+        assert stream.writes == ["info\nerror\n"]
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_starts_flusher_on_first_buffered_write(self, stream):
+        # Arrange
+        sink = BatchedSink(stream, batch_size=100, flush_interval=60)
+        flusher_before_write = sink._flusher
+
+        # Act
+        sink.write("a\n")
+
+        # Assert
+        assert flusher_before_write is None
+        assert sink._flusher.is_alive()
+
+        # Cleanup
+        sink.stop()
+
+    def test_batched_sink_forked_child_writes_pending_messages_on_exit(self, tmp_path):
+        # Arrange
+        log_path = tmp_path / "out.log"
+        with open(log_path, "a") as log_file:
+            sink = BatchedSink(log_file, batch_size=100, flush_interval=60)
+            sink.write("parent\n")
+
+            # Act - multiprocessing children leave through os._exit
+            child = multiprocessing.get_context("fork").Process(target=_log_in_child, args=(sink,))
+            child.start()
+            child.join()
+            sink.stop()
+
+        # Assert - the child neither loses its own line nor repeats the parent's
+        assert log_path.read_text() == "child\nparent\n"
+
+    def test_batched_sink_fork_reset_drops_inherited_state(self, stream, monkeypatch):
+        # Arrange - only this sink is treated as live, so other sinks in the process are untouched
+        sink = BatchedSink(stream, batch_size=100, flush_interval=60)
+        sink.write("parent\n")
+        monkeypatch.setattr(batched_sink_mod, "_live_sinks", {sink})
+
+        # Act
+        batched_sink_mod._reset_sinks_after_fork()
+        sink.stop()
+
+        # Assert - the parent writes its own pending lines, so the child must not repeat them
+        assert stream.writes == []
+        assert sink._flusher is None
+
+    def test_batched_sink_registers_exit_drain_in_multiprocessing_child(self, stream, monkeypatch):
+        # Arrange
+        finalize = Mock()
+        monkeypatch.setattr(batched_sink_mod.mp_util, "Finalize", finalize)
+        sink = BatchedSink(stream, flush_interval=60)
+
+        # Act
+        sink._register_exit_drain()
+
+        # Assert
+        finalize.assert_called_once_with(sink, sink.stop, exitpriority=0)
@@ -0,0 +1,22 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from prompts import prompts
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    # Rendered prompts are cached per (agent, platform, persona); start every test cold
+    prompts._render.cache_clear()
+    yield
+    prompts._render.cache_clear()
+
+
+@pytest.fixture
+def mock_template(monkeypatch):
+    """Serve one mocked template for every agent instead of the cached real ones"""
+    template = MagicMock()
+    template.render.return_value = "rendered prompt"
+    monkeypatch.setattr(prompts, "_get_template", lambda agent_name: template)
+    return template
@@ -1,7 +1,7 @@
-from unittest.mock import MagicMock, patch
+import pytest
 
-from config.non_env import CREATE_REPLY_AGENT, DELETE_COMMENT_AGENT, IGNORE_COMMENT_AGENT
-from prompts.prompts import AGENT_NAME_PROMPT_MAPPING, ALL_PLATFORMS, PromptGenerator
+from config.non_env import CREATE_REPLY_AGENT, DELETE_COMMENT_AGENT, IGNORE_COMMENT_AGENT, PLATFORM_NAME_DESCRIPTION
+from prompts.prompts import AGENT_NAME_PROMPT_MAPPING, ALL_PLATFORMS, PromptGenerator, _get_env, _get_template
 
 
 class TestAgentNamePromptMapping:
@@ -19,8 +19,8 @@ class TestAgentNamePromptMapping:
 
 
 class TestAllPlatforms:
-    def test_all_platforms_is_list(self):
-        assert isinstance(ALL_PLATFORMS, list)
+    def test_all_platforms_is_tuple(self):
+        assert isinstance(ALL_PLATFORMS, tuple)
 
     def test_all_platforms_contains_youtube(self):
         assert "youtube" in ALL_PLATFORMS
@@ -46,26 +46,36 @@ class TestPromptGeneratorInit:
         assert generator.platform == platform
         assert generator.persona == persona
 
+    def test_init_with_empty_persona(self):
+        generator = PromptGenerator(CREATE_REPLY_AGENT, "youtube", "")
+        assert generator.persona == ""
 
-class TestPromptGeneratorGetPromptForAgent:
-    @patch("prompts.prompts._jinja_env")
-    def test_get_prompt_for_agent_loads_correct_template(self, mock_env_instance):
-        mock_template = MagicMock()
-        mock_template.render.return_value = "rendered prompt"
-        mock_env_instance.get_template.return_value = mock_template
 
-        generator = PromptGenerator(CREATE_REPLY_AGENT, "youtube", "test persona")
+class TestAgentTemplateCache:
+    def test_get_env_is_built_once(self):
+        assert _get_env() is _get_env()
+
+    def test_get_env_skips_auto_reload(self):
+        assert _get_env().auto_reload is False
+
+    @pytest.mark.parametrize("agent_name, template_name", list(AGENT_NAME_PROMPT_MAPPING.items()))
+    def test_get_template_loads_mapped_template_file(self, agent_name, template_name):
+        assert _get_template(agent_name).name == f"{template_name}.j2"
+
+    def test_get_template_is_compiled_once(self):
+        assert _get_template(CREATE_REPLY_AGENT) is _get_template(CREATE_REPLY_AGENT)
+
+
+class TestPromptGeneratorGetPromptForAgent:
+    @pytest.mark.parametrize("agent_name", [CREATE_REPLY_AGENT, IGNORE_COMMENT_AGENT, DELETE_COMMENT_AGENT])
+    def test_get_prompt_for_agent_uses_cached_template(self, mock_template, agent_name):
+        generator = PromptGenerator(agent_name, "youtube", "test persona")
         result = generator.get_prompt_for_agent()
 
-        mock_env_instance.get_template.assert_called_once_with("create_reply.j2")
+        mock_template.render.assert_called_once()
         assert result == "rendered prompt"
 
-    @patch("prompts.prompts._jinja_env")
-    def test_get_prompt_for_agent_renders_with_correct_context(self, mock_env_instance):
-        mock_template = MagicMock()
-        mock_template.render.return_value = "rendered prompt"
-        mock_env_instance.get_template.return_value = mock_template
-
+    def test_get_prompt_for_agent_renders_with_correct_context(self, mock_template):
         persona = "friendly assistant"
         platform = "instagram"
         generator = PromptGenerator(IGNORE_COMMENT_AGENT, platform, persona)
@@ -78,32 +88,32 @@ class TestPromptGeneratorGetPromptForAgent:
         assert kwargs["persona"] == persona
         assert kwargs["platform_name"] == platform
         assert "all_platforms" in kwargs
-        assert "platform_description" in kwargs
+        assert kwargs["platform_description"] == PLATFORM_NAME_DESCRIPTION[platform]
 
-    @patch("prompts.prompts._jinja_env")
-    def test_get_prompt_for_agent_with_delete_comment_agent(self, mock_env_instance):
-        mock_template = MagicMock()
-        mock_template.render.return_value = "delete prompt"
-        mock_env_instance.get_template.return_value = mock_template
+    def test_get_prompt_for_agent_platform_without_description(self, mock_template):
+        generator = PromptGenerator(CREATE_REPLY_AGENT, "tiktok", "persona")
+        generator.get_prompt_for_agent()
 
-        generator = PromptGenerator(DELETE_COMMENT_AGENT, "youtube", "test persona")
-        result = generator.get_prompt_for_agent()
+        assert mock_template.render.call_args.kwargs["platform_description"] is None
 
-        mock_env_instance.get_template.assert_called_once_with("delete_comment.j2")
-        assert result == "delete prompt"
+    def test_get_prompt_for_agent_caches_rendered_prompt(self, mock_template):
+        PromptGenerator(CREATE_REPLY_AGENT, "youtube", "persona").get_prompt_for_agent()
+        result = PromptGenerator(CREATE_REPLY_AGENT, "youtube", "persona").get_prompt_for_agent()
 
-    @patch("prompts.prompts._jinja_env")
-    def test_get_prompt_for_agent_uses_file_system_loader(self, mock_env_instance):
-        # This test verifies that we are using the mocked environment
-        # In the original code, it checked strict jinja2 Environment instantiation,
-        # but since we use a module-level instance, we verify interactions with that instance.
+        mock_template.render.assert_called_once()
+        assert result == "rendered prompt"
 
-        mock_template = MagicMock()
-        mock_template.render.return_value = "rendered"
-        mock_env_instance.get_template.return_value = mock_template
+    def test_get_prompt_for_agent_renders_again_for_new_persona(self, mock_template):
+        PromptGenerator(CREATE_REPLY_AGENT, "youtube", "persona").get_prompt_for_agent()
+        PromptGenerator(CREATE_REPLY_AGENT, "youtube", "other persona").get_prompt_for_agent()
 
-        generator = PromptGenerator(CREATE_REPLY_AGENT, "youtube", "persona")
-        generator.get_prompt_for_agent()
+        assert mock_template.render.call_count == 2
+
+    def test_get_prompt_for_agent_renders_real_template(self):
+        generator = PromptGenerator(CREATE_REPLY_AGENT, "youtube", "test persona")
+
+        result = generator.get_prompt_for_agent()
 
-        # Verify get_template was called (which implies interaction with the env)
-        assert mock_env_instance.get_template.called
+        assert isinstance(result, str)
+        assert "test persona" in result
+        assert "['youtube', 'instagram']" in result
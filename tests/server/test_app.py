@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from server import app as app_mod
+from utils.contextvar import clear_request_metadata
+
+
+@pytest.fixture
+def error_records():
+    """Error records emitted through the real loguru logger during the test"""
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record), format="{message}", level="ERROR")
+    yield records
+    logger.remove(handler_id)
+    clear_request_metadata()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A bare app wired with the real request middleware and unhandled exception handler"""
+    # The middleware draws api_id then thread_id from uuid4
+    monkeypatch.setattr(app_mod, "uuid", SimpleNamespace(uuid4=iter(["A1", "T1"]).__next__))
+    test_app = FastAPI()
+    test_app.middleware("http")(app_mod.add_request_metadata)
+    test_app.add_exception_handler(Exception, app_mod.unhandled_exception_handler)
+
+    @test_app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(test_app, raise_server_exceptions=False)
+
+
+def test_unhandled_exception_log_carries_request_metadata(client, error_records):
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert len(error_records) == 1
+    assert error_records[0]["message"].startswith("Error occurred: boom")
+    assert error_records[0]["extra"] == {"api_id": "A1", "thread_id": "T1"}
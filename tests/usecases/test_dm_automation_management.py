@@ -1,32 +1,25 @@
-import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
 from usecases.dm_automation_management import DmAutomationManagement
 from utils.exceptions import CustomBadRequest, ResourceNotFound, CustomUnauthorized
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_user():
-    user = Mock()
-    user.id = 1
-    return user
+    return SimpleNamespace(id=1)
 
 
 @pytest.fixture
 def mock_integration(mock_user):
-    integration = Mock()
-    integration.id = 1
-    integration.user = mock_user
-    return integration
+    return SimpleNamespace(id=1, user=mock_user)
 
 
 @pytest.fixture
 def mock_post(mock_integration):
-    post = Mock()
-    post.id = 1
-    post.post_id = "post123"
-    post.integration = mock_integration
-    return post
+    return SimpleNamespace(id=1, post_id="post123", integration=mock_integration)
 
 
 class TestCreateDmAutomationRule:
@@ -35,7 +28,7 @@ class TestCreateDmAutomationRule:
     def test_create_dm_rule_for_integration_success(
         self, mock_create_rule, mock_get_integration, mock_user, mock_integration
     ):
-        mock_get_integration.return_value.first.return_value = mock_integration
+        mock_get_integration.return_value = SimpleNamespace(first=lambda: mock_integration)
         mock_rule = Mock()
         mock_rule.get_details.return_value = {"id": 1, "trigger_type": "dm"}
         mock_create_rule.return_value = mock_rule
@@ -57,7 +50,7 @@ class TestCreateDmAutomationRule:
     def test_create_comment_rule_for_post_success(
         self, mock_create_rule, mock_get_post, mock_user, mock_post
     ):
-        mock_get_post.return_value.first.return_value = mock_post
+        mock_get_post.return_value = SimpleNamespace(first=lambda: mock_post)
         mock_rule = Mock()
         mock_rule.get_details.return_value = {"id": 1, "trigger_type": "comment"}
         mock_create_rule.return_value = mock_rule
@@ -74,38 +67,53 @@ class TestCreateDmAutomationRule:
         assert result["trigger_type"] == "comment"
         mock_create_rule.assert_called_once()
 
-    @patch("usecases.dm_automation_management.Integration.get_by_uuid_for_user")
-    def test_create_rule_integration_not_found(self, mock_get_integration, mock_user):
-        mock_get_integration.return_value.first.return_value = None
-        with pytest.raises(ResourceNotFound, match="Integration not found."):
-            DmAutomationManagement.create_dm_automation_rule(
-                mock_user, {"trigger_type": "dm"}, integration_uuid="int-uuid"
-            )
-
-    def test_create_comment_rule_no_post_id(self, mock_user):
-        rule_data = {
-            "trigger_type": "comment",
-            "match_type": "EXACT_TEXT",
-        }
-        with pytest.raises(CustomBadRequest, match="`post_id` is required for 'comment' trigger type."):
-            DmAutomationManagement.create_dm_automation_rule(mock_user, rule_data)
-
-    @patch("usecases.dm_automation_management.Post.get_by_post_id")
-    def test_create_comment_rule_post_not_found(self, mock_get_post, mock_user):
-        mock_get_post.return_value.first.return_value = None
-        rule_data = {
-            "post_id": "post123",
-            "trigger_type": "comment",
-            "match_type": "EXACT_TEXT",
-        }
-        with pytest.raises(ResourceNotFound, match="Post not found."):
-            DmAutomationManagement.create_dm_automation_rule(mock_user, rule_data)
+    @pytest.mark.parametrize(
+        "rule_data, patch_target, patch_return, expected_exc, expected_msg",
+        [
+            pytest.param(
+                {"trigger_type": "dm"},
+                "usecases.dm_automation_management.Integration.get_by_uuid_for_user",
+                None,
+                ResourceNotFound,
+                "Integration not found.",
+                id="integration_not_found",
+            ),
+            pytest.param(
+                {"trigger_type": "comment", "match_type": "EXACT_TEXT"},
+                "usecases.dm_automation_management.Post.get_by_post_id",
+                None,
+                CustomBadRequest,
+                "`post_id` is required for 'comment' trigger type.",
+                id="comment_rule_no_post_id",
+            ),
+            pytest.param(
+                {"post_id": "post123", "trigger_type": "comment", "match_type": "EXACT_TEXT"},
+                "usecases.dm_automation_management.Post.get_by_post_id",
+                None,
+                ResourceNotFound,
+                "Post not found.",
+                id="comment_rule_post_not_found",
+            ),
+            pytest.param(
+                {"post_id": "post123", "trigger_type": "dm"},
+                "usecases.dm_automation_management.Integration.get_by_uuid_for_user",
+                Mock(),
+                CustomBadRequest,
+                "`post_id` is not allowed for 'dm' trigger type.",
+                id="dm_rule_with_post_id",
+            ),
+        ],
+    )
+    def test_create_rule_error_paths(self, rule_data, patch_target, patch_return, expected_exc, expected_msg, mock_user):
+        with patch(patch_target) as mock_lookup:
+            mock_lookup.return_value = SimpleNamespace(first=lambda: patch_return)
+            with pytest.raises(expected_exc, match=expected_msg):
+                DmAutomationManagement.create_dm_automation_rule(mock_user, rule_data, integration_uuid="int-uuid")
 
     @patch("usecases.dm_automation_management.Post.get_by_post_id")
     def test_create_comment_rule_unauthorized(self, mock_get_post, mock_user, mock_post):
-        unauthorized_user = Mock()
-        unauthorized_user.id = 2
-        mock_get_post.return_value.first.return_value = mock_post
+        unauthorized_user = SimpleNamespace(id=2)
+        mock_get_post.return_value = SimpleNamespace(first=lambda: mock_post)
         rule_data = {
             "post_id": "post123",
             "trigger_type": "comment",
@@ -113,15 +121,3 @@ class TestCreateDmAutomationRule:
         }
         with pytest.raises(CustomUnauthorized, match="User not authorized for this post."):
             DmAutomationManagement.create_dm_automation_rule(unauthorized_user, rule_data)
-
-    @patch("usecases.dm_automation_management.Integration.get_by_uuid_for_user")
-    def test_create_dm_rule_with_post_id(self, mock_get_integration, mock_user):
-        mock_get_integration.return_value.first.return_value = Mock()
-        rule_data = {
-            "post_id": "post123",
-            "trigger_type": "dm",
-        }
-        with pytest.raises(CustomBadRequest, match="`post_id` is not allowed for 'dm' trigger type."):
-            DmAutomationManagement.create_dm_automation_rule(
-                mock_user, rule_data, integration_uuid="int-uuid"
-            )
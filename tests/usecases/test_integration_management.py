@@ -0,0 +1,468 @@
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from usecases import integration_management as im_mod
+from usecases.integration_management import IntegrationManagement
+from utils.error_messages import INTEGRATION_NOT_FOUND, UNSUPPORTED_PLATFORM, USER_NOT_FOUND
+
+# Expected errors lists, bound once instead of rebuilt in every assertion
+_INF_ERRS = [INTEGRATION_NOT_FOUND]
+_UP_ERRS = [UNSUPPORTED_PLATFORM]
+_UNF_ERRS = [USER_NOT_FOUND]
+
+
+class _NullLogger:
+    create_info_log = staticmethod(lambda *args, **kwargs: None)
+    create_error_log = staticmethod(lambda *args, **kwargs: None)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _null_logger():
+    # Share one no-op logger; the few tests that assert on logging patch it themselves
+    with patch.object(im_mod, "LoggerUtil", _NullLogger):
+        yield
+
+
+class _RequestsStub:
+    """Stand-in for the requests module that replays canned responses"""
+
+    def __init__(self):
+        self.next_response = None
+        self.next_exc = None
+        self.get_payloads = []
+        self.post_calls = []
+        self.get_calls = []
+
+    def post(self, url, **kwargs):
+        self.post_calls.append((url, kwargs))
+        if self.next_exc:
+            raise self.next_exc
+        return self.next_response
+
+    def get(self, url, **kwargs):
+        # Payloads are consumed in order; an exception payload is raised instead
+        self.get_calls.append((url, kwargs))
+        payload = self.get_payloads.pop(0)
+        if isinstance(payload, Exception):
+            raise payload
+        return SimpleNamespace(json=lambda: payload)
+
+
+@pytest.fixture(scope="session")
+def platforms():
+    return im_mod.IntegrationManagement.PLATFORMS
+
+
+@pytest.fixture
+def im_mocks(monkeypatch):
+    """Replace the collaborators of usecases.integration_management with fresh mocks"""
+    mocks = SimpleNamespace(integration=Mock(), user=Mock(), user_model=Mock())
+    monkeypatch.setattr(im_mod, "Integration", mocks.integration)
+    monkeypatch.setattr(im_mod, "get_context_user", mocks.user)
+    monkeypatch.setattr(im_mod, "User", mocks.user_model)
+    return mocks
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze datetime.now() as seen by usecases.integration_management"""
+    fixed = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    fake = Mock(wraps=datetime)
+    fake.now.return_value = fixed
+    monkeypatch.setattr(im_mod, "datetime", fake)
+    return fixed
+
+
+@pytest.fixture
+def requests_stub(monkeypatch):
+    stub = _RequestsStub()
+    monkeypatch.setattr(im_mod, "requests", stub)
+    return stub
+
+
+@pytest.fixture
+def callback_mocks(im_mocks, requests_stub):
+    """im_mocks and requests_stub with shortcuts for handle_oauth_callback tests"""
+
+    def respond_with(payload):
+        # The callback enriches the token response in place, so hand out copies
+        requests_stub.next_response = SimpleNamespace(json=lambda: dict(payload))
+
+    def set_user(user):
+        im_mocks.user_model.get_by_auth0_user_id.return_value = user
+
+    return SimpleNamespace(mocks=im_mocks, requests=requests_stub, respond_with=respond_with, set_user=set_user)
+
+
+def _mk_integration(uuid, platform, status="active"):
+    integration = Mock()
+    integration.get_details.return_value = {"uuid": uuid, "platform": platform, "status": status}
+    return integration
+
+
+class TestGetAllIntegrations:
+    @pytest.mark.parametrize(
+        "integrations, expected_count",
+        [
+            pytest.param([_mk_integration("int-1", "instagram"), _mk_integration("int-2", "youtube")], 2, id="multiple"),
+            pytest.param([], 0, id="empty"),
+            pytest.param([_mk_integration("int-1", "instagram")], 1, id="single"),
+            pytest.param([_mk_integration("int-1", "instagram"), _mk_integration("int-2", "instagram", "inactive")], 2, id="mixed_status"),
+        ],
+    )
+    def test_get_all_integrations(self, im_mocks, integrations, expected_count):
+        mock_user = SimpleNamespace(id=1)
+        im_mocks.user.return_value = mock_user
+        im_mocks.integration.get_all_for_user.return_value = integrations
+
+        error, data, errors = IntegrationManagement.get_all_integrations()
+
+        assert error is None
+        assert len(data) == expected_count
+        assert data == [integration.get_details.return_value for integration in integrations]
+        assert errors is None
+        im_mocks.integration.get_all_for_user.assert_called_once_with(mock_user)
+
+
+class TestGetIntegrationByUuid:
+    def test_get_integration_by_uuid_found(self, im_mocks):
+        mock_user = SimpleNamespace(id=1)
+        im_mocks.user.return_value = mock_user
+        integration = Mock()
+        integration.get_details.return_value = {"uuid": "int-1", "platform": "instagram"}
+        im_mocks.integration.get_by_uuid_for_user.return_value = [integration]
+
+        error, data, errors = IntegrationManagement.get_integration_by_uuid("int-1")
+
+        assert error is None
+        assert data == {"uuid": "int-1", "platform": "instagram"}
+        assert errors is None
+        im_mocks.integration.get_by_uuid_for_user.assert_called_once_with("int-1", mock_user)
+
+    def test_get_integration_by_uuid_not_found(self, im_mocks):
+        im_mocks.user.return_value = SimpleNamespace(id=1)
+        im_mocks.integration.get_by_uuid_for_user.return_value = []
+
+        error, data, errors = IntegrationManagement.get_integration_by_uuid("missing")
+
+        assert error == INTEGRATION_NOT_FOUND
+        assert data is None
+        assert errors == _INF_ERRS
+
+
+# Expected shape of each platform's OAuth authorization URL
+INSTAGRAM_URL_RE = re.compile(r"instagram\.com/oauth/authorize.*client_id=.*redirect_uri=.*/v1/integrations/instagram/oauth/callback.*instagram_business_basic", re.S)
+YOUTUBE_URL_RE = re.compile(r"accounts\.google\.com/o/oauth2/v2/auth.*client_id=.*redirect_uri=.*/v1/integrations/youtube/oauth/callback.*auth/youtube", re.S)
+
+# Token endpoint responses. handle_oauth_callback enriches a successful response
+# in place, so tests that get past the token exchange hand it a copy.
+INSTAGRAM_TOKEN_OK = {"access_token": "short-token", "user_id": "ig-123", "permissions": ["instagram_business_basic"]}
+YOUTUBE_TOKEN_OK = {
+    "access_token": "yt-token",
+    "refresh_token": "yt-refresh",
+    "expires_in": 3599,
+    "scope": "https://www.googleapis.com/auth/youtube",
+    "token_type": "Bearer",
+}
+TOKEN_NO_ACCESS = {"error_message": "Invalid code"}
+TOKEN_NO_REFRESH = {"access_token": "yt-token"}
+TOKEN_NO_EXPIRES_IN = {"access_token": "yt-token", "scope": "scope-a"}
+
+# OAuth state for an existing user coming from the web client
+VALID_STATE = json.dumps({"user_id": "auth0|123", "interface_type": "web"})
+
+# Long-lived token exchange and username lookup made while enriching Instagram data
+INSTAGRAM_ENRICH_RESPONSES = [
+    {"access_token": "long-token", "token_type": "bearer", "expires_in": 5184000},
+    {"id": "ig-123", "username": "ssq_user"},
+]
+
+# (platform, token response, expected expires_in, expected create_or_update_integration kwargs)
+CALLBACK_SUCCESS_CASES = [
+    pytest.param(
+        "instagram",
+        INSTAGRAM_TOKEN_OK,
+        5184000,
+        {
+            "platform_user_id": "ig-123",
+            "platform_username": "ssq_user",
+            "access_token": "long-token",
+            "token_type": "bearer",
+            "scopes": ["instagram_business_basic"],
+            "refresh_token": None,
+            "refresh_token_expires_at": None,
+        },
+        id="instagram",
+    ),
+    pytest.param(
+        "youtube",
+        YOUTUBE_TOKEN_OK,
+        3599,
+        {
+            "access_token": "yt-token",
+            "refresh_token": "yt-refresh",
+            "scopes": ["https://www.googleapis.com/auth/youtube"],
+        },
+        id="youtube",
+    ),
+    pytest.param(
+        "youtube",
+        {"access_token": "yt-token", "refresh_token": "yt-refresh", "expires_in": 3599, "scope": "scope-a,scope-b", "user_id": "yt-123"},
+        3599,
+        {"platform_user_id": "yt-123", "token_type": "Bearer", "scopes": ["scope-a", "scope-b"]},
+        id="youtube_multiple_scopes",
+    ),
+    pytest.param(
+        "youtube",
+        TOKEN_NO_EXPIRES_IN,
+        3600,
+        {"refresh_token": None, "refresh_token_expires_at": None},
+        id="youtube_default_expires_in",
+    ),
+]
+
+
+@pytest.fixture(scope="class")
+def mock_request():
+    request = Mock()
+    request.query_params.get.return_value = "web"
+    return request
+
+
+class TestGetOAuthUrl:
+    @pytest.mark.parametrize(
+        "platform, expected",
+        [
+            ("instagram", INSTAGRAM_URL_RE),
+            ("youtube", YOUTUBE_URL_RE),
+            ("tiktok", None),
+            ("", None),
+        ],
+    )
+    def test_get_oauth_url(self, im_mocks, mock_request, platform, expected):
+        im_mocks.user.return_value = SimpleNamespace(auth0_user_id="auth0|123")
+
+        error, data, errors = IntegrationManagement.get_oauth_url(platform, mock_request)
+
+        if expected is None:
+            assert error == UNSUPPORTED_PLATFORM
+            assert data is None
+            assert errors == _UP_ERRS
+        else:
+            assert error == ""
+            assert expected.search(data)
+            assert errors is None
+
+    def test_get_oauth_url_passes_state_to_instagram(self, im_mocks, mock_request):
+        im_mocks.user.return_value = SimpleNamespace(auth0_user_id="auth0|123")
+
+        error, data, errors = IntegrationManagement.get_oauth_url("instagram", mock_request)
+
+        assert VALID_STATE in data
+
+    def test_get_oauth_url_defaults_interface_type_to_web(self, im_mocks):
+        im_mocks.user.return_value = SimpleNamespace(auth0_user_id="auth0|123")
+        request = Mock()
+        request.query_params.get.return_value = "web"
+
+        IntegrationManagement.get_oauth_url("instagram", request)
+
+        request.query_params.get.assert_called_once_with("interface_type", "web")
+
+
+class TestHandleOAuthCallback:
+    @pytest.mark.parametrize("platform, response, expires_in, expected", CALLBACK_SUCCESS_CASES)
+    def test_handle_oauth_callback_success(self, callback_mocks, frozen_now, platform, response, expires_in, expected):
+        mock_user = SimpleNamespace(id=1)
+        callback_mocks.set_user(mock_user)
+        callback_mocks.respond_with(response)
+        callback_mocks.requests.get_payloads = list(INSTAGRAM_ENRICH_RESPONSES)
+
+        error, data, errors = IntegrationManagement.handle_oauth_callback(platform, "auth-code", VALID_STATE)
+
+        assert error == ""
+        assert errors is None
+        callback_mocks.mocks.user_model.get_by_auth0_user_id.assert_called_once_with("auth0|123")
+        kwargs = callback_mocks.mocks.integration.create_or_update_integration.call_args.kwargs
+        assert kwargs["user"] is mock_user
+        assert kwargs["platform"] == platform
+        assert kwargs["expires_at"] == frozen_now + timedelta(seconds=expires_in)
+        assert {key: kwargs[key] for key in expected} == expected
+
+    def test_handle_oauth_callback_exchanges_code_for_token(self, callback_mocks):
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+
+        IntegrationManagement.handle_oauth_callback("youtube", "auth-code", VALID_STATE)
+
+        assert len(callback_mocks.requests.post_calls) == 1
+        _, post_kwargs = callback_mocks.requests.post_calls[0]
+        assert post_kwargs["data"]["code"] == "auth-code"
+        assert post_kwargs["data"]["grant_type"] == "authorization_code"
+        assert post_kwargs["data"]["redirect_uri"].endswith("/v1/integrations/youtube/oauth/callback")
+
+    def test_handle_oauth_callback_verifies_token_expiration(self, callback_mocks, frozen_now):
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.respond_with({"access_token": "yt-token", "refresh_token": "yt-refresh", "expires_in": 7200, "refresh_token_expires_in": 86400})
+
+        IntegrationManagement.handle_oauth_callback("youtube", "auth-code", VALID_STATE)
+
+        kwargs = callback_mocks.mocks.integration.create_or_update_integration.call_args.kwargs
+        assert kwargs["expires_at"] == frozen_now + timedelta(seconds=7200)
+        assert kwargs["refresh_token_expires_at"] == frozen_now + timedelta(seconds=86400)
+
+    def test_handle_oauth_callback_redirects_web_interface(self, callback_mocks):
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+
+        with patch.object(im_mod, "SSQ_CLIENT_WEB_URL", "https://web.example.com"):
+            error, data, errors = IntegrationManagement.handle_oauth_callback("youtube", "auth-code", VALID_STATE)
+
+        assert data == "https://web.example.com"
+
+    def test_handle_oauth_callback_redirects_mobile_interface(self, callback_mocks):
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+        state = json.dumps({"user_id": "auth0|123", "interface_type": "mobile"})
+
+        with patch.object(im_mod, "SSQ_CLIENT_MOBILE_URL", "ssq://mobile"):
+            error, data, errors = IntegrationManagement.handle_oauth_callback("youtube", "auth-code", state)
+
+        assert data == "ssq://mobile"
+
+    def test_handle_oauth_callback_unsupported_platform(self, callback_mocks):
+        result = IntegrationManagement.handle_oauth_callback("tiktok", "auth-code", "{}")
+
+        assert result == (UNSUPPORTED_PLATFORM, None, _UP_ERRS)
+        assert callback_mocks.requests.post_calls == []
+
+    def test_handle_oauth_callback_token_exchange_failure(self, callback_mocks):
+        callback_mocks.respond_with(TOKEN_NO_ACCESS)
+
+        result = IntegrationManagement.handle_oauth_callback("instagram", "bad-code", "{}")
+
+        assert result == ("Error fetching access token", None, ["Invalid code"])
+        callback_mocks.mocks.integration.create_or_update_integration.assert_not_called()
+
+    def test_handle_oauth_callback_token_exchange_failure_without_message(self, callback_mocks):
+        callback_mocks.respond_with({"error": "invalid_grant"})
+
+        result = IntegrationManagement.handle_oauth_callback("youtube", "bad-code", "{}")
+
+        assert result == ("Error fetching access token", None, ["Unknown error"])
+
+    def test_handle_oauth_callback_user_not_found(self, callback_mocks):
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+        callback_mocks.set_user(None)
+
+        result = IntegrationManagement.handle_oauth_callback("youtube", "auth-code", VALID_STATE)
+
+        assert result == (USER_NOT_FOUND, None, _UNF_ERRS)
+        callback_mocks.mocks.integration.create_or_update_integration.assert_not_called()
+
+    def test_handle_oauth_callback_invalid_state(self, callback_mocks):
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+
+        error, data, errors = IntegrationManagement.handle_oauth_callback("youtube", "auth-code", "not-json")
+
+        assert (error, data, len(errors)) == ("Error in handle_oauth_callback", None, 1)
+
+    def test_handle_oauth_callback_request_exception(self, callback_mocks):
+        callback_mocks.requests.next_exc = Exception("Connection refused")
+
+        result = IntegrationManagement.handle_oauth_callback("instagram", "auth-code", "{}")
+
+        assert result == ("Error in handle_oauth_callback", None, ["Connection refused"])
+
+    def test_handle_oauth_callback_save_failure(self, callback_mocks):
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.mocks.integration.create_or_update_integration.side_effect = Exception("DB error")
+
+        result = IntegrationManagement.handle_oauth_callback("youtube", "auth-code", VALID_STATE)
+
+        assert result == ("Error in handle_oauth_callback", None, ["DB error"])
+
+    def test_handle_oauth_callback_platform_without_enrichment(self, callback_mocks, monkeypatch, platforms):
+        monkeypatch.setitem(platforms, "threads", platforms["instagram"])
+        callback_mocks.set_user(SimpleNamespace(id=1))
+        callback_mocks.respond_with(TOKEN_NO_REFRESH)
+
+        error, data, errors = IntegrationManagement.handle_oauth_callback("threads", "auth-code", VALID_STATE)
+
+        assert error == ""
+        assert callback_mocks.requests.get_calls == []
+        kwargs = callback_mocks.mocks.integration.create_or_update_integration.call_args.kwargs
+        assert kwargs["scopes"] == []
+
+
+class TestEnrichInstagramData:
+    def test_enrich_instagram_data_keeps_short_token_when_exchange_fails(self, requests_stub, platforms):
+        requests_stub.get_payloads = [
+            {"error": {"message": "Invalid token"}},
+            {"id": "ig-123", "username": "ssq_user"},
+        ]
+        config = platforms["instagram"]
+
+        result = IntegrationManagement._enrich_instagram_data(config, {"access_token": "short-token"})
+
+        assert result["access_token"] == "short-token"
+        assert result["platform_username"] == "ssq_user"
+        assert result["scopes"] == []
+
+    def test_enrich_instagram_data_username_fetch_failure(self, requests_stub, platforms):
+        requests_stub.get_payloads = [
+            {"access_token": "long-token", "expires_in": 5184000},
+            Exception("Timeout"),
+        ]
+        config = platforms["instagram"]
+
+        with patch.object(im_mod, "LoggerUtil") as mock_logger:
+            result = IntegrationManagement._enrich_instagram_data(config, {"access_token": "short-token", "permissions": ["basic"]})
+
+        assert result["access_token"] == "long-token"
+        assert "platform_username" not in result
+        assert result["scopes"] == ["basic"]
+        mock_logger.create_error_log.assert_called_once()
+
+
+class TestDeleteIntegration:
+    def test_delete_integration_success(self, im_mocks):
+        mock_user = SimpleNamespace(id=1)
+        im_mocks.user.return_value = mock_user
+        im_mocks.integration.delete_by_uuid_for_user.return_value = 1
+
+        error, data, errors = IntegrationManagement.delete_integration("int-1")
+
+        assert error == ""
+        assert data is None
+        assert errors is None
+        im_mocks.integration.delete_by_uuid_for_user.assert_called_once_with("int-1", mock_user)
+
+    @pytest.mark.parametrize("return_value", [0, None])
+    def test_delete_integration_not_found(self, im_mocks, return_value):
+        im_mocks.user.return_value = SimpleNamespace(id=1)
+        im_mocks.integration.delete_by_uuid_for_user.return_value = return_value
+
+        error, data, errors = IntegrationManagement.delete_integration("missing")
+
+        assert error == INTEGRATION_NOT_FOUND
+        assert data is None
+        assert errors == _INF_ERRS
+
+
+class TestPlatformConfiguration:
+    def test_platforms_supported(self, platforms):
+        assert set(platforms) == {"instagram", "youtube"}
+
+    @pytest.mark.parametrize("platform", ["instagram", "youtube"])
+    def test_platform_config_shape(self, platforms, platform):
+        assert {"auth_url", "token_url", "client_id", "client_secret", "scope"}.issubset(platforms[platform])
+
+    def test_platforms_using_refresh_token(self):
+        assert IntegrationManagement.PLATFORMS_USING_REFRESH_TOKEN == ["youtube"]
@@ -1,143 +1,174 @@
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, create_autospec
 
-from usecases.onboarding_management import OnboardingManagement
+import pytest
 
+from data_adapter.db import ssq_db
+from data_adapter.user import User
+from usecases import onboarding_management as om_mod
+from usecases.onboarding_management import OnboardingManagement
 
-class TestOnboardingManagementOnboardUser:
-    @patch("data_adapter.db.ssq_db.is_closed", return_value=False)
-    @patch("data_adapter.db.ssq_db.connect")
-    @patch("data_adapter.db.ssq_db.begin")
-    @patch("data_adapter.db.ssq_db.commit")
-    @patch("usecases.onboarding_management.PersonaManagement.create_persona")
-    def test_onboard_user_success(self, mock_create_persona, mock_commit, mock_begin, mock_connect, mock_is_closed):
-        mock_user = Mock()
-        mock_user.update_values = Mock()
-
-        persona_data = {"uuid": "persona_123", "name": "Test Persona"}
-        mock_create_persona.return_value = ("", persona_data, None)
-
-        error, data, errors = OnboardingManagement.onboard_user(
-            user=mock_user,
-            persona_name="Test Persona",
-            tone="Professional",
-            style="Formal",
-            instructions="Be professional",
-            role="brand",
-            content_categories=["tech", "gaming"],
-            personal_details="About me",
-        )
-
-        assert error == ""
-        assert data == persona_data
-        assert errors is None
-        mock_user.update_values.assert_called_once_with(role="brand", content_categories=["tech", "gaming"], status="active")
-
-    @patch("data_adapter.db.ssq_db.is_closed", return_value=False)
-    @patch("data_adapter.db.ssq_db.connect")
-    @patch("data_adapter.db.ssq_db.begin")
-    @patch("data_adapter.db.ssq_db.commit")
-    @patch("data_adapter.db.ssq_db.rollback")
-    @patch("usecases.onboarding_management.PersonaManagement.create_persona")
-    @patch("usecases.onboarding_management.LoggerUtil.create_error_log")
-    def test_onboard_user_persona_creation_fails(self, mock_log, mock_create_persona, mock_rollback, mock_commit, mock_begin, mock_connect, mock_is_closed):
-        mock_user = Mock()
-
-        mock_create_persona.return_value = ("Persona already exists", None, {"name": ["already exists"]})
-
-        error, data, errors = OnboardingManagement.onboard_user(
-            user=mock_user,
-            persona_name="Duplicate",
-            tone="Casual",
-            style="Friendly",
-            instructions="Be friendly",
-            role="creator",
-            content_categories=["music"],
-        )
-
-        assert error == "Persona already exists"
-        assert data is None
-        assert errors == {"name": ["already exists"]}
-        mock_rollback.assert_called_once()
-
-    @patch("data_adapter.db.ssq_db.is_closed", return_value=False)
-    @patch("data_adapter.db.ssq_db.connect")
-    @patch("data_adapter.db.ssq_db.begin")
-    @patch("data_adapter.db.ssq_db.commit")
-    @patch("data_adapter.db.ssq_db.rollback")
-    @patch("usecases.onboarding_management.PersonaManagement.create_persona")
-    @patch("usecases.onboarding_management.LoggerUtil.create_error_log")
-    def test_onboard_user_update_values_fails(self, mock_log, mock_create_persona, mock_rollback, mock_commit, mock_begin, mock_connect, mock_is_closed):
-        mock_user = Mock()
-        mock_user.update_values.side_effect = Exception("Database error")
-
-        persona_data = {"uuid": "persona_123"}
-        mock_create_persona.return_value = ("", persona_data, None)
-
-        error, data, errors = OnboardingManagement.onboard_user(
-            user=mock_user,
-            persona_name="Test",
-            tone="Casual",
-            style="Friendly",
-            instructions="Test",
-            role="brand",
-            content_categories=["tech"],
-        )
-
-        assert "Failed to update user fields" in error
-        assert data is None
-        assert errors == "Database error"
-        mock_rollback.assert_called_once()
-
-    @patch("data_adapter.db.ssq_db.is_closed", return_value=False)
-    @patch("data_adapter.db.ssq_db.connect")
-    @patch("data_adapter.db.ssq_db.begin")
-    @patch("data_adapter.db.ssq_db.commit")
-    @patch("data_adapter.db.ssq_db.rollback")
-    @patch("usecases.onboarding_management.PersonaManagement.create_persona")
-    @patch("usecases.onboarding_management.LoggerUtil.create_error_log")
-    def test_onboard_user_unexpected_exception(self, mock_log, mock_create_persona, mock_rollback, mock_commit, mock_begin, mock_connect, mock_is_closed):
-        mock_user = Mock()
-
-        mock_create_persona.side_effect = Exception("Unexpected error")
-
-        error, data, errors = OnboardingManagement.onboard_user(
-            user=mock_user,
-            persona_name="Test",
-            tone="Casual",
-            style="Friendly",
-            instructions="Test",
-            role="brand",
-            content_categories=["tech"],
-        )
-
-        assert "Unexpected error during onboarding" in error
-        assert data is None
-        assert errors == "Unexpected error"
-        mock_rollback.assert_called_once()
-
-    @patch("data_adapter.db.ssq_db.is_closed", return_value=False)
-    @patch("data_adapter.db.ssq_db.connect")
-    @patch("data_adapter.db.ssq_db.begin")
-    @patch("data_adapter.db.ssq_db.commit")
-    @patch("usecases.onboarding_management.PersonaManagement.create_persona")
-    def test_onboard_user_with_optional_personal_details(self, mock_create_persona, mock_commit, mock_begin, mock_connect, mock_is_closed):
-        mock_user = Mock()
-        mock_user.update_values = Mock()
-
-        persona_data = {"uuid": "persona_123"}
-        mock_create_persona.return_value = ("", persona_data, None)
-
-        error, data, errors = OnboardingManagement.onboard_user(
-            user=mock_user,
-            persona_name="Test",
-            tone="Casual",
-            style="Friendly",
-            instructions="Test",
-            role="brand",
-            content_categories=["tech"],
-            personal_details=None,
-        )
-
-        assert error == ""
-        call_kwargs = mock_create_persona.call_args.kwargs
-        assert call_kwargs["personal_details"] is None
+# Read-only persona payloads shared by every test; variants override single fields
+PERSONA_DATA_FULL = MappingProxyType({"uuid": "persona_uuid_123", "name": "Business Persona", "tone": "Professional", "style": "Formal"})
+PERSONA_DATA_CASUAL = MappingProxyType({**PERSONA_DATA_FULL, "name": "Casual Persona", "tone": "Casual", "style": "Friendly"})
+
+PERSONA_FAIL_LOG_FMT = "Persona creation failed during onboarding: {err}"
+UPDATE_FAIL_MSG_FMT = "Failed to update user fields: {err}"
+UNEXPECTED_MSG_FMT = "Unexpected error during onboarding: {err}"
+
+
+class _FakeDB:
+    """Stand-in for ssq_db that only supports atomic() and counts rollbacks"""
+
+    def __init__(self):
+        self.rollback_calls = 0
+
+    def atomic(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def rollback(self):
+        self.rollback_calls += 1
+
+
+@pytest.fixture(scope="module")
+def onboarding_transaction():
+    """Keep the real database behind ssq_db.atomic() away from a connection, once per module"""
+    # onboard_user is wrapped by ssq_db.atomic() at import time, so the real database
+    # still drives the transaction even when the module-level ssq_db is swapped out
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ssq_db, "is_closed", lambda: False)
+        for name in ("connect", "begin", "commit"):
+            mp.setattr(ssq_db, name, Mock())
+        yield
+
+
+@pytest.fixture
+def patched_onboarding(onboarding_transaction, monkeypatch):
+    """Replace ssq_db and PersonaManagement.create_persona in usecases.onboarding_management with fresh mocks"""
+    mocks = SimpleNamespace(db=_FakeDB(), create_persona=Mock())
+    monkeypatch.setattr(om_mod, "ssq_db", mocks.db)
+    monkeypatch.setattr(om_mod.PersonaManagement, "create_persona", mocks.create_persona)
+    return mocks
+
+
+@pytest.fixture
+def onboarding_logger(monkeypatch):
+    """Replace LoggerUtil in usecases.onboarding_management; only the error paths log"""
+    messages = []
+    logger = SimpleNamespace(create_error_log=messages.append, error_messages=messages)
+    monkeypatch.setattr(om_mod, "LoggerUtil", logger)
+    return logger
+
+
+@pytest.fixture(scope="module")
+def user_spec():
+    """An autospec of User built once per module; attributes User lacks raise"""
+    return create_autospec(User, instance=True)
+
+
+@pytest.fixture
+def user(user_spec):
+    user_spec.reset_mock(return_value=True, side_effect=True)
+    return user_spec
+
+
+@pytest.mark.parametrize(
+    "role,content_categories,personal_details,persona_data",
+    [
+        ("brand", ["tech", "gaming"], "About me", PERSONA_DATA_FULL),
+        ("brand", ["tech"], None, PERSONA_DATA_FULL),
+        ("brand", [], None, PERSONA_DATA_FULL),
+        ("creator", ["tech", "business", "finance", "startup", "ai"], "Multi-niche creator", PERSONA_DATA_FULL),
+        ("influencer", ["lifestyle", "travel"], None, PERSONA_DATA_CASUAL),
+    ],
+    ids=["all_fields", "no_personal_details", "empty_categories", "multi_categories", "influencer_role"],
+)
+def test_onboard_user_success(patched_onboarding, user, role, content_categories, personal_details, persona_data):
+    patched_onboarding.create_persona.return_value = ("", persona_data, None)
+
+    error, data, errors = OnboardingManagement.onboard_user(
+        user=user,
+        persona_name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        role=role,
+        content_categories=content_categories,
+        personal_details=personal_details,
+    )
+
+    assert error == ""
+    assert data == persona_data
+    assert errors is None
+    assert patched_onboarding.create_persona.call_args.kwargs["personal_details"] == personal_details
+    user.update_values.assert_called_once_with(role=role, content_categories=content_categories, status="active")
+    assert patched_onboarding.db.rollback_calls == 0
+
+
+def test_onboard_user_persona_creation_fails(patched_onboarding, onboarding_logger, user):
+    patched_onboarding.create_persona.return_value = ("Persona already exists", None, {"name": ["already exists"]})
+
+    error, data, errors = OnboardingManagement.onboard_user(
+        user=user,
+        persona_name="Duplicate",
+        tone="Casual",
+        style="Friendly",
+        instructions="Be friendly",
+        role="creator",
+        content_categories=["music"],
+    )
+
+    assert error == "Persona already exists"
+    assert data is None
+    assert errors == {"name": ["already exists"]}
+    user.update_values.assert_not_called()
+    assert onboarding_logger.error_messages == [PERSONA_FAIL_LOG_FMT.format(err="Persona already exists")]
+    assert patched_onboarding.db.rollback_calls == 1
+
+
+def test_onboard_user_update_values_fails(patched_onboarding, onboarding_logger, user):
+    user.update_values.side_effect = Exception("Database error")
+
+    patched_onboarding.create_persona.return_value = ("", PERSONA_DATA_FULL, None)
+
+    error, data, errors = OnboardingManagement.onboard_user(
+        user=user,
+        persona_name="Test",
+        tone="Casual",
+        style="Friendly",
+        instructions="Test",
+        role="brand",
+        content_categories=["tech"],
+    )
+
+    assert error == UPDATE_FAIL_MSG_FMT.format(err="Database error")
+    assert data is None
+    assert errors == "Database error"
+    assert onboarding_logger.error_messages == [error]
+    assert patched_onboarding.db.rollback_calls == 1
+
+
+def test_onboard_user_unexpected_exception(patched_onboarding, onboarding_logger, user):
+    patched_onboarding.create_persona.side_effect = Exception("Unexpected error")
+
+    error, data, errors = OnboardingManagement.onboard_user(
+        user=user,
+        persona_name="Test",
+        tone="Casual",
+        style="Friendly",
+        instructions="Test",
+        role="brand",
+        content_categories=["tech"],
+    )
+
+    assert error == UNEXPECTED_MSG_FMT.format(err="Unexpected error")
+    assert data is None
+    assert errors == "Unexpected error"
+    assert onboarding_logger.error_messages == [error]
+    assert patched_onboarding.db.rollback_calls == 1
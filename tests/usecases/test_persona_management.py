@@ -0,0 +1,404 @@
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from usecases import persona_management as pm_mod
+from usecases.persona_management import PersonaManagement
+from utils.error_messages import INVALID_PAGINATION_PARAMETERS, PERSONA_ALREADY_EXISTS, RESOURCE_NOT_FOUND
+
+# Read-only get_details() payloads shared by the tests
+PROFESSIONAL_TEMPLATE = MappingProxyType({"uuid": "uuid1", "name": "Professional", "tone": "Formal", "style": "Concise"})
+CASUAL_TEMPLATE = MappingProxyType({"uuid": "uuid2", "name": "Casual", "tone": "Friendly", "style": "Chatty"})
+MY_PERSONA = MappingProxyType({"uuid": "p1", "name": "My Persona", "tone": "Professional", "style": "Formal"})
+WORK_PERSONA = MappingProxyType({"uuid": "p2", "name": "Work Persona", "tone": "Casual", "style": "Friendly"})
+TEST_PERSONA_DETAILS = MappingProxyType({"uuid": "persona_uuid", "name": "Test Persona", "tone": "Professional", "style": "Formal"})
+UPDATED_PERSONA_DETAILS = MappingProxyType({"uuid": "persona_uuid", "name": "Updated", "tone": "Casual", "style": "Friendly"})
+ORIGINAL_PERSONA_DETAILS = MappingProxyType({"uuid": "persona_uuid", "name": "Original", "tone": "Casual"})
+
+# Attributes PersonaManagement reads or writes on a persona; anything else raises
+PERSONA_ATTRS = ["get_details", "user", "uuid", "name", "tone", "style", "instructions", "personal_details", "save"]
+
+
+class _StubPersona:
+    """Read-only persona or template that only answers get_details()"""
+
+    __slots__ = ("_details",)
+
+    def __init__(self, details):
+        self._details = details
+
+    def get_details(self):
+        return self._details
+
+
+# Listed personas and templates are only ever read, so these serve every test
+TEMPLATES = (_StubPersona(PROFESSIONAL_TEMPLATE), _StubPersona(CASUAL_TEMPLATE))
+USER_PERSONAS = (_StubPersona(MY_PERSONA), _StubPersona(WORK_PERSONA))
+
+
+@pytest.fixture(scope="module")
+def persona_patches():
+    """Replace Persona and PersonaTemplate in usecases.persona_management once per module"""
+    mocks = SimpleNamespace(persona=Mock(), template=Mock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pm_mod, "Persona", mocks.persona)
+        mp.setattr(pm_mod, "PersonaTemplate", mocks.template)
+        yield mocks
+
+
+@pytest.fixture
+def persona_mocks(persona_patches):
+    """persona_patches with return values, side effects and calls reset for this test"""
+    for mock in vars(persona_patches).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return persona_patches
+
+
+@pytest.fixture
+def persona_logger(monkeypatch):
+    """Replace LoggerUtil in usecases.persona_management; only create_persona's error path logs"""
+    logger = Mock()
+    monkeypatch.setattr(pm_mod, "LoggerUtil", logger)
+    return logger
+
+
+@pytest.fixture(scope="module")
+def mock_user():
+    return SimpleNamespace(id=1)
+
+
+@pytest.fixture
+def make_persona():
+    """Build a fresh persona double whose get_details returns details"""
+
+    # A fresh Mock per call: copies of one shared Mock would share its child mocks.
+    # configure_mock, unlike Mock(**attrs), sets "name" as a plain attribute
+    def _make_persona(details=None, **attrs):
+        persona = Mock(spec_set=PERSONA_ATTRS, get_details=Mock(return_value=details))
+        persona.configure_mock(**attrs)
+        return persona
+
+    return _make_persona
+
+
+def test_get_persona_templates_success(persona_mocks):
+    persona_mocks.template.get_all_templates.return_value = TEMPLATES
+
+    error, data, errors = PersonaManagement.get_persona_templates()
+
+    assert error == ""
+    assert data == [PROFESSIONAL_TEMPLATE, CASUAL_TEMPLATE]
+    assert errors is None
+
+
+def test_get_persona_templates_empty(persona_mocks):
+    persona_mocks.template.get_all_templates.return_value = []
+
+    error, data, errors = PersonaManagement.get_persona_templates()
+
+    assert error == ""
+    assert data == []
+    assert errors is None
+
+
+def test_get_user_personas_success(persona_mocks, mock_user):
+    persona_mocks.persona.get_all_for_user.return_value = USER_PERSONAS
+    persona_mocks.persona.get_all_for_user_count.return_value = 2
+
+    error, data, errors = PersonaManagement.get_user_personas(mock_user, page=1, page_size=10)
+
+    assert error == ""
+    assert data == {
+        "items": [MY_PERSONA, WORK_PERSONA],
+        "total": 2,
+        "page": 1,
+        "page_size": 10,
+        "total_pages": 1,
+    }
+    assert errors is None
+    persona_mocks.persona.get_all_for_user.assert_called_once_with(mock_user, 1, 10)
+    persona_mocks.persona.get_all_for_user_count.assert_called_once_with(mock_user)
+
+
+def test_get_user_personas_empty(persona_mocks, mock_user):
+    persona_mocks.persona.get_all_for_user.return_value = []
+    persona_mocks.persona.get_all_for_user_count.return_value = 0
+
+    error, data, errors = PersonaManagement.get_user_personas(mock_user)
+
+    assert error == ""
+    assert data == {"items": [], "total": 0, "page": 1, "page_size": 10, "total_pages": 0}
+    assert errors is None
+
+
+@pytest.mark.parametrize(
+    "page,page_size",
+    [(0, 10), (1, 0), (1, 101)],
+    ids=["page_less_than_one", "page_size_less_than_one", "page_size_greater_than_100"],
+)
+def test_get_user_personas_invalid_pagination(persona_mocks, mock_user, page, page_size):
+    error, data, errors = PersonaManagement.get_user_personas(mock_user, page=page, page_size=page_size)
+
+    assert error == INVALID_PAGINATION_PARAMETERS
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.get_all_for_user.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "total,page,page_size,expected_pages",
+    [(250, 1, 100, 3), (21, 3, 10, 3), (20, 1, 10, 2), (1, 1, 1, 1)],
+    ids=["page_size_exactly_100", "partial_last_page", "exact_multiple", "page_size_one"],
+)
+def test_get_user_personas_total_pages_calculation(persona_mocks, mock_user, total, page, page_size, expected_pages):
+    persona_mocks.persona.get_all_for_user.return_value = []
+    persona_mocks.persona.get_all_for_user_count.return_value = total
+
+    error, data, errors = PersonaManagement.get_user_personas(mock_user, page=page, page_size=page_size)
+
+    assert error == ""
+    assert data["page"] == page
+    assert data["page_size"] == page_size
+    assert data["total"] == total
+    assert data["total_pages"] == expected_pages
+    assert errors is None
+
+
+def test_create_persona_success(persona_mocks, mock_user, make_persona):
+    persona_mocks.persona.get_by_name_and_user.return_value = None
+    mock_created_persona = make_persona(TEST_PERSONA_DETAILS)
+    persona_mocks.persona.create_persona.return_value = mock_created_persona
+
+    error, data, errors = PersonaManagement.create_persona(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        content_categories=["tech"],
+        role="brand",
+        personal_details="About me",
+    )
+
+    assert error == ""
+    assert data == TEST_PERSONA_DETAILS
+    assert errors is None
+    persona_mocks.persona.get_by_name_and_user.assert_called_once_with("Test Persona", mock_user)
+    persona_mocks.persona.create_persona.assert_called_once_with(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        role="brand",
+        content_categories=["tech"],
+        personal_details="About me",
+    )
+
+
+def test_create_persona_success_without_personal_details(persona_mocks, mock_user, make_persona):
+    persona_mocks.persona.get_by_name_and_user.return_value = None
+    mock_created_persona = make_persona(TEST_PERSONA_DETAILS)
+    persona_mocks.persona.create_persona.return_value = mock_created_persona
+
+    error, data, errors = PersonaManagement.create_persona(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        content_categories=["tech"],
+        role="brand",
+    )
+
+    assert error == ""
+    assert data == TEST_PERSONA_DETAILS
+    assert errors is None
+    assert persona_mocks.persona.create_persona.call_args.kwargs["personal_details"] == ""
+
+
+def test_create_persona_already_exists(persona_mocks, mock_user, make_persona):
+    persona_mocks.persona.get_by_name_and_user.return_value = make_persona()
+
+    error, data, errors = PersonaManagement.create_persona(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        content_categories=["tech"],
+        role="brand",
+    )
+
+    assert error == PERSONA_ALREADY_EXISTS
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.create_persona.assert_not_called()
+
+
+def test_create_persona_exception_handling(persona_mocks, persona_logger, mock_user):
+    persona_mocks.persona.get_by_name_and_user.return_value = None
+    persona_mocks.persona.create_persona.side_effect = Exception("Database error")
+
+    error, data, errors = PersonaManagement.create_persona(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        content_categories=["tech"],
+        role="brand",
+    )
+
+    assert error == "Failed to create persona: Database error"
+    assert data is None
+    assert errors is None
+    persona_logger.create_error_log.assert_called_once()
+
+
+def test_create_persona_exception_during_existence_check(persona_mocks, persona_logger, mock_user):
+    persona_mocks.persona.get_by_name_and_user.side_effect = Exception("Connection lost")
+
+    error, data, errors = PersonaManagement.create_persona(
+        user=mock_user,
+        name="Test Persona",
+        tone="Professional",
+        style="Formal",
+        instructions="Be professional",
+        content_categories=["tech"],
+        role="brand",
+    )
+
+    assert error == "Failed to create persona: Connection lost"
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.create_persona.assert_not_called()
+    persona_logger.create_error_log.assert_called_once()
+
+
+def test_update_persona_success(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(UPDATED_PERSONA_DETAILS, user=mock_user)
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+    persona_mocks.persona.get_by_name_and_user.return_value = None
+
+    error, data, errors = PersonaManagement.update_persona(
+        user=mock_user,
+        persona_uuid="persona_uuid",
+        name="Updated",
+        tone="Casual",
+        style="Friendly",
+        instructions="Be friendly",
+        personal_details="New details",
+    )
+
+    assert error == ""
+    assert data == UPDATED_PERSONA_DETAILS
+    assert errors is None
+    assert mock_persona_instance.name == "Updated"
+    assert mock_persona_instance.tone == "Casual"
+    assert mock_persona_instance.style == "Friendly"
+    assert mock_persona_instance.instructions == "Be friendly"
+    assert mock_persona_instance.personal_details == "New details"
+    mock_persona_instance.save.assert_called_once()
+
+
+def test_update_persona_partial_update(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(ORIGINAL_PERSONA_DETAILS, user=mock_user, name="Original")
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+
+    error, data, errors = PersonaManagement.update_persona(user=mock_user, persona_uuid="persona_uuid", tone="Casual")
+
+    assert error == ""
+    assert data == ORIGINAL_PERSONA_DETAILS
+    assert errors is None
+    assert mock_persona_instance.name == "Original"
+    assert mock_persona_instance.tone == "Casual"
+    persona_mocks.persona.get_by_name_and_user.assert_not_called()
+    mock_persona_instance.save.assert_called_once()
+
+
+def test_update_persona_no_changes(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(ORIGINAL_PERSONA_DETAILS, user=mock_user)
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+
+    error, data, errors = PersonaManagement.update_persona(user=mock_user, persona_uuid="persona_uuid")
+
+    assert error == ""
+    assert data == ORIGINAL_PERSONA_DETAILS
+    assert errors is None
+    mock_persona_instance.save.assert_not_called()
+
+
+@pytest.mark.parametrize("owner_id", [None, 2], ids=["not_found", "wrong_user"])
+def test_update_persona_not_found_paths(persona_mocks, mock_user, make_persona, owner_id):
+    # owner_id None means no persona matches the uuid
+    mock_persona_instance = None if owner_id is None else make_persona(user=SimpleNamespace(id=owner_id))
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+
+    error, data, errors = PersonaManagement.update_persona(user=mock_user, persona_uuid="persona_uuid", name="Updated")
+
+    assert error == RESOURCE_NOT_FOUND
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.get_by_name_and_user.assert_not_called()
+    if mock_persona_instance:
+        mock_persona_instance.save.assert_not_called()
+
+
+def test_update_persona_name_already_exists(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(user=mock_user)
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+    persona_mocks.persona.get_by_name_and_user.return_value = make_persona(uuid="other_uuid")
+
+    error, data, errors = PersonaManagement.update_persona(user=mock_user, persona_uuid="persona_uuid", name="Taken Name")
+
+    assert error == PERSONA_ALREADY_EXISTS
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.get_by_name_and_user.assert_called_once_with("Taken Name", mock_user)
+    mock_persona_instance.save.assert_not_called()
+
+
+def test_update_persona_name_to_same_name(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(TEST_PERSONA_DETAILS, user=mock_user)
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+    persona_mocks.persona.get_by_name_and_user.return_value = make_persona(uuid="persona_uuid")
+
+    error, data, errors = PersonaManagement.update_persona(user=mock_user, persona_uuid="persona_uuid", name="Test Persona")
+
+    assert error == ""
+    assert data == TEST_PERSONA_DETAILS
+    assert errors is None
+    mock_persona_instance.save.assert_called_once()
+
+
+def test_delete_persona_success(persona_mocks, mock_user, make_persona):
+    mock_persona_instance = make_persona(user=mock_user)
+    persona_mocks.persona.get_by_uuid.return_value = mock_persona_instance
+    persona_mocks.persona.delete_by_uuid.return_value = True
+
+    error, data, errors = PersonaManagement.delete_persona("persona_uuid", mock_user)
+
+    assert error == ""
+    assert data is None
+    assert errors is None
+    persona_mocks.persona.delete_by_uuid.assert_called_once_with("persona_uuid")
+
+
+@pytest.mark.parametrize(
+    "owner_id,deleted,delete_calls",
+    [(None, True, 0), (2, True, 0), (1, False, 1)],
+    ids=["not_found", "wrong_user", "deletion_fails"],
+)
+def test_delete_persona_not_found_paths(persona_mocks, mock_user, make_persona, owner_id, deleted, delete_calls):
+    # owner_id None means no persona matches the uuid
+    persona_mocks.persona.get_by_uuid.return_value = None if owner_id is None else make_persona(user=SimpleNamespace(id=owner_id))
+    persona_mocks.persona.delete_by_uuid.return_value = deleted
+
+    error, data, errors = PersonaManagement.delete_persona("persona_uuid", mock_user)
+
+    assert error == RESOURCE_NOT_FOUND
+    assert data is None
+    assert errors is None
+    assert persona_mocks.persona.delete_by_uuid.call_count == delete_calls
@@ -1,146 +1,109 @@
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from config.non_env import CREATE_REPLY_AGENT, DELETE_COMMENT_AGENT, IGNORE_COMMENT_AGENT
+from config.non_env import CREATE_REPLY_AGENT, DELETE_COMMENT_AGENT, GEMINI_MODEL_NAME, IGNORE_COMMENT_AGENT
+from usecases import ssq_agent as ssq_mod
 from usecases.ssq_agent import SSQAgent
 
 
-class TestSSQAgentInit:
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    def test_ssq_agent_initialization(self, mock_prompt_gen, mock_agent, mock_google_model):
-        mock_prompt = "Test system prompt"
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = mock_prompt
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
+def _returning(result):
+    """Plain coroutine function standing in for Agent.run; cheaper than an AsyncMock"""
 
-        agent = SSQAgent(CREATE_REPLY_AGENT, "instagram", "friendly assistant")
+    async def _run(*args, **kwargs):
+        return result
 
-        assert agent.agent_name == CREATE_REPLY_AGENT
-        assert agent.system_prompt == mock_prompt
-        mock_prompt_gen.assert_called_once_with(CREATE_REPLY_AGENT, "instagram", "friendly assistant")
+    return _run
 
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    def test_ssq_agent_creates_agent_with_string_output_for_create_reply(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt = "Test prompt"
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = mock_prompt
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
 
-        SSQAgent(CREATE_REPLY_AGENT, "youtube", "persona")
+@pytest.fixture(scope="module")
+def ssq_patches():
+    """Replace the pydantic-ai classes and PromptGenerator in usecases.ssq_agent once per module"""
+    # Attribute names match the usecases.ssq_agent globals they replace
+    mocks = SimpleNamespace(Agent=Mock(), GoogleModel=Mock(), GoogleModelSettings=Mock(), PromptGenerator=Mock())
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock in vars(mocks).items():
+            mp.setattr(ssq_mod, name, mock)
+        yield mocks
 
-        call_kwargs = mock_agent_class.call_args.kwargs
-        assert call_kwargs["output_type"] is str
-        assert call_kwargs["system_prompt"] == mock_prompt
 
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    def test_ssq_agent_creates_agent_with_bool_output_for_ignore_comment(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt = "Test prompt"
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = mock_prompt
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
+@pytest.fixture
+def ssq_env(ssq_patches, monkeypatch):
+    """ssq_patches reset for this test, with every PromptGenerator returning the same prompt"""
+    for mock in vars(ssq_patches).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    ssq_patches.PromptGenerator.return_value.get_prompt_for_agent.return_value = "prompt"
+    # Drop the model cached on the class so each test builds it from its own mocks
+    monkeypatch.setattr(ssq_mod.SSQAgent, "_model_instance", None)
+    return ssq_patches
 
-        SSQAgent(IGNORE_COMMENT_AGENT, "instagram", "persona")
 
-        call_kwargs = mock_agent_class.call_args.kwargs
-        assert call_kwargs["output_type"] is bool
+class TestSSQAgentInit:
+    def test_ssq_agent_initialization(self, ssq_env):
+        agent = SSQAgent(CREATE_REPLY_AGENT, "instagram", "friendly assistant")
 
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    def test_ssq_agent_creates_agent_with_bool_output_for_delete_comment(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt = "Test prompt"
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = mock_prompt
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
+        assert agent.agent_name == CREATE_REPLY_AGENT
+        assert agent.system_prompt == "prompt"
+        ssq_env.PromptGenerator.assert_called_once_with(CREATE_REPLY_AGENT, "instagram", "friendly assistant")
+        ssq_env.GoogleModel.assert_called_once_with(model_name=GEMINI_MODEL_NAME, settings=ssq_env.GoogleModelSettings.return_value)
 
-        SSQAgent(DELETE_COMMENT_AGENT, "instagram", "persona")
+    def test_ssq_agent_reuses_cached_model(self, ssq_env):
+        first = SSQAgent(CREATE_REPLY_AGENT, "instagram", "persona")
+        second = SSQAgent(IGNORE_COMMENT_AGENT, "youtube", "persona")
 
-        call_kwargs = mock_agent_class.call_args.kwargs
-        assert call_kwargs["output_type"] is bool
+        ssq_env.GoogleModel.assert_called_once()
+        assert first._get_model() is second._get_model()
+
+    @pytest.mark.parametrize(
+        "agent_name,output_type",
+        [(CREATE_REPLY_AGENT, str), (DELETE_COMMENT_AGENT, bool), (IGNORE_COMMENT_AGENT, bool)],
+        ids=["create_reply", "delete_comment", "ignore_comment"],
+    )
+    def test_ssq_agent_creates_agent_with_output_type(self, ssq_env, agent_name, output_type):
+        SSQAgent(agent_name, "instagram", "persona")
+
+        call_kwargs = ssq_env.Agent.call_args.kwargs
+        assert call_kwargs["output_type"] is output_type
+        assert call_kwargs["system_prompt"] == "prompt"
+        assert call_kwargs["model"] is ssq_env.GoogleModel.return_value
 
 
 class TestSSQAgentGenerateResponse:
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    @pytest.mark.asyncio
-    async def test_generate_response_returns_agent_output(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = "prompt"
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
-
-        mock_agent_instance = Mock()
+    async def test_generate_response_returns_agent_output(self, ssq_env):
         mock_result = Mock()
         mock_result.data = "This is a response"
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        ssq_env.Agent.return_value.run = _returning(mock_result)
 
         agent = SSQAgent(CREATE_REPLY_AGENT, "instagram", "persona")
         result = await agent.generate_response("Great post!")
 
         assert result == "This is a response"
 
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    @pytest.mark.asyncio
-    async def test_generate_response_strips_surrounding_quotes(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = "prompt"
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
-
-        mock_agent_instance = Mock()
+    async def test_generate_response_strips_surrounding_quotes(self, ssq_env):
         mock_result = Mock()
         mock_result.data = '"This is quoted"'
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        ssq_env.Agent.return_value.run = _returning(mock_result)
 
         agent = SSQAgent(CREATE_REPLY_AGENT, "instagram", "persona")
         result = await agent.generate_response("Comment")
 
         assert result == "This is quoted"
 
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    @pytest.mark.asyncio
-    async def test_generate_response_does_not_strip_non_matching_quotes(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = "prompt"
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
-
-        mock_agent_instance = Mock()
+    async def test_generate_response_does_not_strip_non_matching_quotes(self, ssq_env):
         mock_result = Mock()
         mock_result.data = '"Only start quote'
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        ssq_env.Agent.return_value.run = _returning(mock_result)
 
         agent = SSQAgent(CREATE_REPLY_AGENT, "instagram", "persona")
         result = await agent.generate_response("Comment")
 
-        assert result == 'Only start quote'
-
-    @patch("usecases.ssq_agent.GoogleModel")
-    @patch("usecases.ssq_agent.Agent")
-    @patch("usecases.ssq_agent.PromptGenerator")
-    @pytest.mark.asyncio
-    async def test_generate_response_handles_bool_output(self, mock_prompt_gen, mock_agent_class, mock_google_model):
-        mock_prompt_gen_instance = Mock()
-        mock_prompt_gen_instance.get_prompt_for_agent.return_value = "prompt"
-        mock_prompt_gen.return_value = mock_prompt_gen_instance
+        assert result == "Only start quote"
 
-        mock_agent_instance = Mock()
+    async def test_generate_response_handles_bool_output(self, ssq_env):
         mock_result = Mock()
         mock_result.data = True
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        ssq_env.Agent.return_value.run = _returning(mock_result)
 
         agent = SSQAgent(IGNORE_COMMENT_AGENT, "instagram", "persona")
         result = await agent.generate_response("spam comment")
@@ -1,69 +1,57 @@
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from usecases import status_management as sm
 from usecases.status_management import StatusManagement
 
 
+@pytest.fixture(scope="session")
+def make_request():
+    """Factory for a StatusManagement request; headers is a plain dict holding raise-exception when given"""
+
+    def _make_request(header_val=None):
+        return SimpleNamespace(headers={"raise-exception": header_val} if header_val else {})
+
+    return _make_request
+
+
 class TestStatusManagementGetStatus:
-    def test_get_status_returns_ok_without_exception_header(self):
-        mock_request = Mock()
-        mock_request.headers.get.return_value = None
+    def test_get_status_returns_ok_without_exception_header(self, make_request):
+        request = make_request()
 
-        error, data, extra = StatusManagement.get_status(mock_request)
+        error, data, extra = StatusManagement.get_status(request)
 
         assert error == ""
         assert data == {"status": "ok"}
         assert extra is None
 
-    def test_get_status_raises_exception_when_header_present(self):
-        mock_request = Mock()
-        mock_request.headers.get.return_value = "Test exception"
+    def test_get_status_raises_exception_when_header_present(self, make_request):
+        request = make_request("Test exception")
 
         with pytest.raises(Exception, match="Test exception"):
-            StatusManagement.get_status(mock_request)
-
-    def test_get_status_checks_raise_exception_header(self):
-        mock_request = Mock()
-        mock_request.headers.get.return_value = None
-
-        StatusManagement.get_status(mock_request)
-
-        mock_request.headers.get.assert_called_with("raise-exception")
+            StatusManagement.get_status(request)
 
 
 class TestStatusManagementGetDeepStatus:
-    @patch("usecases.status_management.get_db_status")
-    @patch("usecases.status_management.LoggerUtil.create_info_log")
-    def test_get_deep_status_with_healthy_db(self, mock_log, mock_get_db_status):
-        mock_request = Mock()
-        mock_get_db_status.return_value = ("ok", False)
-
-        error, data, extra = StatusManagement.get_deep_status(mock_request)
-
-        assert error == ""
-        assert data == {"ssq_db": {"response": "ok", "error": False}}
+    @pytest.mark.parametrize(
+        "db_ret,err,resp",
+        [
+            (("ok", False), "", "ok"),
+            (("Connection failed", True), "Deep status check failed", "Connection failed"),
+            (("Connection timeout", True), "Deep status check failed", "Connection timeout"),
+        ],
+        ids=["healthy_db", "db_error", "db_timeout"],
+    )
+    @patch.object(sm, "get_db_status")
+    @patch.object(sm.LoggerUtil, "create_info_log")
+    def test_get_deep_status(self, mock_log, mock_get_db_status, make_request, db_ret, err, resp):
+        mock_get_db_status.return_value = db_ret
+
+        error, data, extra = StatusManagement.get_deep_status(make_request())
+
+        assert error == err
+        assert data == {"ssq_db": {"response": resp, "error": db_ret[1]}}
         assert extra is None
         mock_log.assert_called_once_with("Status controller: get_deep_status")
-
-    @patch("usecases.status_management.get_db_status")
-    @patch("usecases.status_management.LoggerUtil.create_info_log")
-    def test_get_deep_status_with_db_error(self, mock_log, mock_get_db_status):
-        mock_request = Mock()
-        mock_get_db_status.return_value = ("Connection failed", True)
-
-        error, data, extra = StatusManagement.get_deep_status(mock_request)
-
-        assert error == "Deep status check failed"
-        assert data == {"ssq_db": {"response": "Connection failed", "error": True}}
-        assert extra is None
-
-    @patch("usecases.status_management.get_db_status")
-    @patch("usecases.status_management.LoggerUtil.create_info_log")
-    def test_get_deep_status_logs_info(self, mock_log, mock_get_db_status):
-        mock_request = Mock()
-        mock_get_db_status.return_value = ("ok", False)
-
-        StatusManagement.get_deep_status(mock_request)
-
-        mock_log.assert_called_once()
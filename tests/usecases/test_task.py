@@ -1,172 +1,178 @@
-from unittest.mock import AsyncMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
 from config.non_env import Platform
+from usecases import task as task_mod
 from usecases.task import process_meta_comment_change, process_meta_webhook
 
+# Every coroutine test here only awaits mocks, so they share one event loop per module
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Read-only payloads built once per module; process_meta_comment_change only reads its input
+COMMENT_CHANGE = MappingProxyType(
+    {
+        "id": "comment_123",
+        "platform_user_id": "user_456",
+        "media": {"id": "post_789"},
+        "from": {"id": "author_111", "username": "john_doe"},
+        "text": "Great post!",
+    }
+)
+REPLY_CHANGE = MappingProxyType(
+    {
+        "id": "reply_123",
+        "platform_user_id": "user_456",
+        "media": {"id": "post_789"},
+        "parent_id": "parent_comment_111",
+        "from": {"id": "author_222", "username": "jane_doe"},
+        "text": "Thanks!",
+    }
+)
+NON_INSTAGRAM_WEBHOOK = MappingProxyType({"object": "facebook", "entry": []})
+
+
+class _Recorder:
+    """Awaitable stand-in that records (args, kwargs) per call; cheaper than an AsyncMock"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _task_patches():
+    """Replace the usecases.task collaborators once per module"""
+    mocks = SimpleNamespace(handle_incoming_comment=_Recorder(), LoggerUtil=Mock(), process_meta_comment_change=SimpleNamespace(kiq=_Recorder()))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(task_mod.WebhookManagement, "handle_incoming_comment", mocks.handle_incoming_comment)
+        mp.setattr(task_mod, "LoggerUtil", mocks.LoggerUtil)
+        mp.setattr(task_mod, "process_meta_comment_change", mocks.process_meta_comment_change)
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def task_mocks(_task_patches):
+    """_task_patches with recorded calls cleared for this test"""
+    _task_patches.handle_incoming_comment.calls.clear()
+    _task_patches.process_meta_comment_change.kiq.calls.clear()
+    _task_patches.LoggerUtil.reset_mock()
+    return _task_patches
+
 
 class TestProcessMetaCommentChange:
-    @patch("usecases.task.WebhookManagement.handle_incoming_comment")
-    @pytest.mark.asyncio
-    async def test_process_meta_comment_change_calls_webhook_management(self, mock_handle_comment):
-        mock_handle_comment.return_value = AsyncMock()
-
-        webhook_data = {
-            "id": "comment_123",
-            "platform_user_id": "user_456",
-            "media": {"id": "post_789"},
-            "from": {"id": "author_111", "username": "john_doe"},
-            "text": "Great post!",
-        }
-
-        await process_meta_comment_change(webhook_data)
-
-        mock_handle_comment.assert_called_once_with(
-            webhook_id="comment_123",
-            comment_data=webhook_data,
-            platform=Platform.INSTAGRAM,
-            platform_user_id="user_456",
-            post_id="post_789",
-            comment_id="comment_123",
-            parent_comment_id=None,
-            author_id="author_111",
-            author_username="john_doe",
-            comment="Great post!",
-        )
-
-    @patch("usecases.task.WebhookManagement.handle_incoming_comment")
-    @pytest.mark.asyncio
-    async def test_process_meta_comment_change_with_parent_id(self, mock_handle_comment):
-        mock_handle_comment.return_value = AsyncMock()
-
-        webhook_data = {
-            "id": "reply_123",
-            "platform_user_id": "user_456",
-            "media": {"id": "post_789"},
-            "parent_id": "parent_comment_111",
-            "from": {"id": "author_222", "username": "jane_doe"},
-            "text": "Thanks!",
-        }
-
-        await process_meta_comment_change(webhook_data)
-
-        call_kwargs = mock_handle_comment.call_args.kwargs
-        assert call_kwargs["parent_comment_id"] == "parent_comment_111"
+    async def test_process_meta_comment_change_calls_webhook_management(self, task_mocks):
+        await process_meta_comment_change(COMMENT_CHANGE)
 
+        assert task_mocks.handle_incoming_comment.calls == [
+            (
+                (),
+                {
+                    "webhook_id": "comment_123",
+                    "comment_data": COMMENT_CHANGE,
+                    "platform": Platform.INSTAGRAM,
+                    "platform_user_id": "user_456",
+                    "post_id": "post_789",
+                    "comment_id": "comment_123",
+                    "parent_comment_id": None,
+                    "author_id": "author_111",
+                    "author_username": "john_doe",
+                    "comment": "Great post!",
+                },
+            )
+        ]
 
-class TestProcessMetaWebhook:
-    @patch("usecases.task.LoggerUtil.create_info_log")
-    @pytest.mark.asyncio
-    async def test_process_meta_webhook_ignores_non_instagram(self, mock_log):
-        webhook_data = {"object": "facebook", "entry": []}
+    async def test_process_meta_comment_change_with_parent_id(self, task_mocks):
+        await process_meta_comment_change(REPLY_CHANGE)
 
-        result = await process_meta_webhook(webhook_data)
+        assert task_mocks.handle_incoming_comment.calls[-1][1]["parent_comment_id"] == "parent_comment_111"
 
-        assert result == "Ignore non-instagram webhook from meta"
-        mock_log.assert_called_with("Ignore non-instagram webhook from meta")
 
-    @patch("usecases.task.process_meta_comment_change")
-    @patch("usecases.task.LoggerUtil.create_info_log")
-    @pytest.mark.asyncio
-    async def test_process_meta_webhook_processes_comment_change(self, mock_log, mock_process_comment):
-        mock_process_comment.kiq = AsyncMock()
+class TestProcessMetaWebhook:
+    async def test_process_meta_webhook_ignores_non_instagram(self, task_mocks):
+        result = await process_meta_webhook(NON_INSTAGRAM_WEBHOOK)
+
+        assert result == "Ignore non-instagram webhook from meta"
+        task_mocks.LoggerUtil.create_info_log.assert_called_with("Ignore non-instagram webhook from meta")
 
-        webhook_data = {
-            "object": "instagram",
-            "entry": [
+    @pytest.mark.parametrize(
+        "webhook_data,expected",
+        [
+            pytest.param(
                 {
-                    "id": "platform_user_123",
-                    "changes": [
+                    "object": "instagram",
+                    "entry": [
                         {
-                            "field": "comments",
-                            "value": {
-                                "id": "comment_456",
-                                "media": {"id": "post_789"},
-                                "from": {"id": "author_111", "username": "user1"},
-                                "text": "Nice!",
-                            },
+                            "id": "platform_user_123",
+                            "changes": [
+                                {
+                                    "field": "comments",
+                                    "value": {
+                                        "id": "comment_456",
+                                        "media": {"id": "post_789"},
+                                        "from": {"id": "author_111", "username": "user1"},
+                                        "text": "Nice!",
+                                    },
+                                }
+                            ],
                         }
                     ],
-                }
-            ],
-        }
-
-        await process_meta_webhook(webhook_data)
-
-        expected_data = {
-            "id": "comment_456",
-            "media": {"id": "post_789"},
-            "from": {"id": "author_111", "username": "user1"},
-            "text": "Nice!",
-            "platform_user_id": "platform_user_123",
-        }
-        mock_process_comment.kiq.assert_called_once_with(expected_data)
-
-    @patch("usecases.task.process_meta_comment_change")
-    @patch("usecases.task.LoggerUtil.create_info_log")
-    @pytest.mark.asyncio
-    async def test_process_meta_webhook_ignores_non_comment_field(self, mock_log, mock_process_comment):
-        mock_process_comment.kiq = AsyncMock()
-
-        webhook_data = {
-            "object": "instagram",
-            "entry": [
+                },
+                [
+                    {
+                        "id": "comment_456",
+                        "media": {"id": "post_789"},
+                        "from": {"id": "author_111", "username": "user1"},
+                        "text": "Nice!",
+                        "platform_user_id": "platform_user_123",
+                    }
+                ],
+                id="comment_change",
+            ),
+            pytest.param(
                 {
-                    "id": "platform_user_123",
-                    "changes": [
-                        {"field": "likes", "value": {"count": 5}},
-                        {"field": "shares", "value": {"count": 2}},
+                    "object": "instagram",
+                    "entry": [
+                        {
+                            "id": "platform_user_123",
+                            "changes": [
+                                {"field": "likes", "value": {"count": 5}},
+                                {"field": "shares", "value": {"count": 2}},
+                            ],
+                        }
                     ],
-                }
-            ],
-        }
-
-        await process_meta_webhook(webhook_data)
-
-        mock_process_comment.kiq.assert_not_called()
-
-    @patch("usecases.task.process_meta_comment_change")
-    @patch("usecases.task.LoggerUtil.create_info_log")
-    @pytest.mark.asyncio
-    async def test_process_meta_webhook_processes_multiple_entries(self, mock_log, mock_process_comment):
-        mock_process_comment.kiq = AsyncMock()
-
-        webhook_data = {
-            "object": "instagram",
-            "entry": [
-                {
-                    "id": "user_1",
-                    "changes": [{"field": "comments", "value": {"id": "comment_1", "text": "First"}}],
                 },
+                [],
+                id="non_comment_fields",
+            ),
+            pytest.param(
                 {
-                    "id": "user_2",
-                    "changes": [{"field": "comments", "value": {"id": "comment_2", "text": "Second"}}],
+                    "object": "instagram",
+                    "entry": [
+                        {"id": "user_1", "changes": [{"field": "comments", "value": {"id": "comment_1", "text": "First"}}]},
+                        {"id": "user_2", "changes": [{"field": "comments", "value": {"id": "comment_2", "text": "Second"}}]},
+                    ],
                 },
-            ],
-        }
-
-        await process_meta_webhook(webhook_data)
-
-        assert mock_process_comment.kiq.call_count == 2
-
-    @patch("usecases.task.process_meta_comment_change")
-    @patch("usecases.task.LoggerUtil.create_info_log")
-    @pytest.mark.asyncio
-    async def test_process_meta_webhook_injects_platform_user_id(self, mock_log, mock_process_comment):
-        mock_process_comment.kiq = AsyncMock()
-
-        webhook_data = {
-            "object": "instagram",
-            "entry": [
+                [
+                    {"id": "comment_1", "text": "First", "platform_user_id": "user_1"},
+                    {"id": "comment_2", "text": "Second", "platform_user_id": "user_2"},
+                ],
+                id="multiple_entries",
+            ),
+            pytest.param(
                 {
-                    "id": "injected_platform_id",
-                    "changes": [{"field": "comments", "value": {"id": "comment_1", "text": "Test"}}],
-                }
-            ],
-        }
-
+                    "object": "instagram",
+                    "entry": [{"id": "injected_platform_id", "changes": [{"field": "comments", "value": {"id": "comment_1", "text": "Test"}}]}],
+                },
+                [{"id": "comment_1", "text": "Test", "platform_user_id": "injected_platform_id"}],
+                id="injects_platform_user_id",
+            ),
+        ],
+    )
+    async def test_process_meta_webhook_enqueues_comment_changes(self, task_mocks, webhook_data, expected):
         await process_meta_webhook(webhook_data)
 
-        called_data = mock_process_comment.kiq.call_args[0][0]
-        assert called_data["platform_user_id"] == "injected_platform_id"
+        assert [args[0] for args, _ in task_mocks.process_meta_comment_change.kiq.calls] == expected